@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import re
+import threading
+import time
 import unicodedata
+from collections import OrderedDict
 from collections.abc import Iterable, Sequence
 from datetime import date
 from decimal import Decimal
 from enum import Enum
 from typing import TYPE_CHECKING, Annotated, Any, cast
+from urllib.parse import urlsplit, urlunsplit
 
 import httpx
 from botocore.client import BaseClient
@@ -102,17 +107,54 @@ StructureEditor = Annotated[User, Depends(require_structure_editor)]
 SLUG_SANITIZE_RE = re.compile(r"[^a-z0-9]+")
 
 _WEBSITE_CHECK_TIMEOUT = 5.0
+_WEBSITE_CHECK_CONCURRENCY = 8
+_WEBSITE_CHECK_CACHE_TTL = 300.0
+_WEBSITE_CHECK_CACHE_SIZE = 512
 
+# Reachability of recently probed URLs, keyed by normalised URL, so repeated saves of
+# the same structure don't hit the network again within the TTL.
+_website_check_cache: OrderedDict[str, tuple[float, bool]] = OrderedDict()
+_website_check_cache_lock = threading.Lock()
 
-def _website_responds(client: httpx.Client, url: str) -> bool:
+
+def _website_cache_key(url: str) -> str:
+    parts = urlsplit(url)
+    return urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), parts.path or "/", parts.query, "")
+    )
+
+
+def _get_cached_reachability(key: str) -> bool | None:
+    now = time.monotonic()
+    with _website_check_cache_lock:
+        entry = _website_check_cache.get(key)
+        if entry is None:
+            return None
+        checked_at, reachable = entry
+        if now - checked_at > _WEBSITE_CHECK_CACHE_TTL:
+            del _website_check_cache[key]
+            return None
+        _website_check_cache.move_to_end(key)
+        return reachable
+
+
+def _store_reachability(key: str, reachable: bool) -> None:
+    with _website_check_cache_lock:
+        _website_check_cache[key] = (time.monotonic(), reachable)
+        _website_check_cache.move_to_end(key)
+        while len(_website_check_cache) > _WEBSITE_CHECK_CACHE_SIZE:
+            _website_check_cache.popitem(last=False)
+
+
+async def _website_responds(client: httpx.AsyncClient, url: str) -> bool:
     try:
-        response = client.head(url, headers={"User-Agent": "ScoutHouse/website-check"})
+        response = await client.head(url, headers={"User-Agent": "ScoutHouse/website-check"})
     except httpx.HTTPError:
         response = None
 
     if response is None or response.status_code >= 400:
         try:
-            response = client.get(url, headers={"User-Agent": "ScoutHouse/website-check"})
+            response = await client.get(url, headers={"User-Agent": "ScoutHouse/website-check"})
         except httpx.HTTPError:
             return False
 
@@ -123,24 +165,55 @@ def _website_responds(client: httpx.Client, url: str) -> bool:
     return False
 
 
+async def _find_unreachable_urls(urls: list[str]) -> set[str]:
+    semaphore = asyncio.Semaphore(_WEBSITE_CHECK_CONCURRENCY)
+    limits = httpx.Limits(
+        max_connections=_WEBSITE_CHECK_CONCURRENCY,
+        max_keepalive_connections=_WEBSITE_CHECK_CONCURRENCY,
+    )
+
+    async with httpx.AsyncClient(
+        timeout=_WEBSITE_CHECK_TIMEOUT, follow_redirects=True, limits=limits
+    ) as client:
+
+        async def _probe(url: str) -> bool:
+            async with semaphore:
+                try:
+                    return await _website_responds(client, url)
+                except httpx.HTTPError:
+                    return False
+
+        results = await asyncio.gather(*(_probe(url) for url in urls))
+
+    return {url for url, reachable in zip(urls, results, strict=True) if not reachable}
+
+
 def _check_website_urls(urls: Iterable[str | AnyHttpUrl]) -> list[str]:
     candidates = [str(url) for url in urls if url]
     if not candidates:
         return []
 
-    warnings: list[str] = []
-    try:
-        with httpx.Client(timeout=_WEBSITE_CHECK_TIMEOUT, follow_redirects=True) as client:
-            for url in candidates:
-                try:
-                    if not _website_responds(client, url):
-                        warnings.append(url)
-                except httpx.HTTPError:
-                    warnings.append(url)
-    except httpx.HTTPError:
-        return []
+    keys = {url: _website_cache_key(url) for url in candidates}
+    unreachable: set[str] = set()
+    to_probe: list[str] = []
+    for url, key in keys.items():
+        reachable = _get_cached_reachability(key)
+        if reachable is None:
+            to_probe.append(url)
+        elif not reachable:
+            unreachable.add(url)
+
+    if to_probe:
+        # Probes run concurrently so the handler waits roughly one round trip, not one per URL.
+        try:
+            probed_unreachable = asyncio.run(_find_unreachable_urls(to_probe))
+        except httpx.HTTPError:
+            return []
+        for url in to_probe:
+            _store_reachability(keys[url], url not in probed_unreachable)
+        unreachable |= probed_unreachable
 
-    return warnings
+    return [url for url in candidates if url in unreachable]
 
 
 def _ensure_storage_ready() -> tuple[str, S3Client]:
@@ -28,6 +28,9 @@ class Settings(BaseSettings):
     secure_cookies: bool = Field(False, alias="SECURE_COOKIES")
     frontend_base_url: str = Field("http://localhost:5173", alias="FRONTEND_BASE_URL")
     password_reset_ttl_minutes: int = Field(60, alias="PASSWORD_RESET_TTL_MINUTES")
+    argon2_time_cost: int = Field(3, ge=1, alias="ARGON2_TIME_COST")
+    argon2_memory_cost: int = Field(65536, ge=8, alias="ARGON2_MEMORY_COST")
+    argon2_parallelism: int = Field(4, ge=1, alias="ARGON2_PARALLELISM")
     log_level: str = Field("INFO", alias="LOG_LEVEL")
     log_json: bool = Field(True, alias="LOG_JSON")
     sentry_dsn: str | None = Field(None, alias="SENTRY_DSN")
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 from hashlib import sha256
 
 from argon2 import PasswordHasher
@@ -12,16 +13,28 @@ from sqlalchemy.orm import Session
 from app.core.config import get_settings
 from app.models import RefreshToken
 
-_password_hasher = PasswordHasher()
+
+@lru_cache
+def _build_password_hasher(time_cost: int, memory_cost: int, parallelism: int) -> PasswordHasher:
+    return PasswordHasher(time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism)
+
+
+def _password_hasher() -> PasswordHasher:
+    settings = get_settings()
+    return _build_password_hasher(
+        settings.argon2_time_cost,
+        settings.argon2_memory_cost,
+        settings.argon2_parallelism,
+    )
 
 
 def hash_password(password: str) -> str:
-    return _password_hasher.hash(password)
+    return _password_hasher().hash(password)
 
 
 def verify_password(password: str, password_hash: str) -> bool:
     try:
-        _password_hasher.verify(password_hash, password)
+        _password_hasher().verify(password_hash, password)
         return True
     except VerifyMismatchError:
         return False
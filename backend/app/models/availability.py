@@ -35,12 +35,10 @@ class StructureSeasonAvailability(Base):
     structure_id: Mapped[int] = mapped_column(
         ForeignKey("structures.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     season: Mapped[StructureSeason] = mapped_column(
         sqla_enum(StructureSeason, name="structure_season"),
         nullable=False,
-        index=True,
     )
     units: Mapped[list[str]] = mapped_column(JSON, nullable=False, default=list)
     capacity_min: Mapped[int | None] = mapped_column(Integer, nullable=True)
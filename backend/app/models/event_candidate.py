@@ -4,7 +4,7 @@ from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -31,6 +31,7 @@ class EventStructureCandidateStatus(str, Enum):
 
 class EventStructureCandidate(Base):
     __tablename__ = "event_structure_candidate"
+    __table_args__ = {"postgresql_with": {"fillfactor": 85}}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     event_id: Mapped[int] = mapped_column(
@@ -70,4 +71,11 @@ class EventStructureCandidate(Base):
         return None
 
 
+Index(
+    "ix_event_structure_candidate_contact_id",
+    EventStructureCandidate.contact_id,
+    postgresql_where=EventStructureCandidate.contact_id.is_not(None),
+    sqlite_where=EventStructureCandidate.contact_id.is_not(None),
+)
+
 __all__ = ["EventStructureCandidate", "EventStructureCandidateStatus"]
@@ -33,6 +33,7 @@ class EventContactTaskOutcome(str, Enum):
 
 class EventContactTask(Base):
     __tablename__ = "event_contact_task"
+    __table_args__ = {"postgresql_with": {"fillfactor": 85}}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     event_id: Mapped[int] = mapped_column(
@@ -554,12 +554,16 @@ Index(
     "ix_structure_open_periods_structure_season",
     StructureOpenPeriod.structure_id,
     StructureOpenPeriod.season,
+    postgresql_where=StructureOpenPeriod.kind == StructureOpenPeriodKind.SEASON,
+    sqlite_where=StructureOpenPeriod.kind == StructureOpenPeriodKind.SEASON,
 )
 Index(
     "ix_structure_open_periods_structure_dates",
     StructureOpenPeriod.structure_id,
     StructureOpenPeriod.date_start,
     StructureOpenPeriod.date_end,
+    postgresql_where=StructureOpenPeriod.kind == StructureOpenPeriodKind.RANGE,
+    sqlite_where=StructureOpenPeriod.kind == StructureOpenPeriodKind.RANGE,
 )
 
 __all__ = [
@@ -1,17 +1,25 @@
 from __future__ import annotations
 
 import csv
-import re
+import posixpath
+import sys
+import zipfile
 from collections.abc import Iterator, Sequence
 import json
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, datetime
 from decimal import Decimal
-from io import BytesIO, StringIO
-from typing import Literal
+from functools import lru_cache
+from io import BytesIO, StringIO, TextIOWrapper
+from typing import Literal, NamedTuple
 from urllib.parse import urlparse
+from xml.etree import ElementTree
 
-from openpyxl import Workbook, load_workbook
+from defusedxml import DefusedXmlException
+from defusedxml import ElementTree as SafeElementTree
+from openpyxl import Workbook
+from openpyxl.styles.numbers import BUILTIN_FORMATS, is_date_format, is_timedelta_format
+from openpyxl.utils.datetime import CALENDAR_MAC_1904, WINDOWS_EPOCH, from_excel, from_ISO8601
 from pydantic import EmailStr, TypeAdapter
 
 from app.models.availability import StructureUnit
@@ -25,6 +33,12 @@ from app.models.structure import (
 
 EMAIL_ADAPTER = TypeAdapter(EmailStr)
 
+# Multi-valued cells accept several separators; translating them to a single
+# one lets us split with ``str.split`` instead of going through the regex engine.
+_LIST_SEP_TRANS = str.maketrans({";": ","})
+_EMAIL_SEP_TRANS = str.maketrans({";": "\n", ",": "\n"})
+_URL_SEP_TRANS = str.maketrans({";": "\n"})
+
 HEADERS = [
     "name",
     "slug",
@@ -171,15 +185,14 @@ OPEN_PERIOD_TEMPLATE_SAMPLE_ROWS: list[dict[str, object]] = [
 ]
 
 
-@dataclass(slots=True)
-class RowError:
+class RowError(NamedTuple):
     row: int
     field: str
     message: str
     source_format: TemplateFormat
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class StructureImportRow:
     row: int
     name: str
@@ -223,7 +236,7 @@ class ParsedWorkbook:
     source_format: TemplateFormat
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class StructureOpenPeriodImportRow:
     row: int
     structure_slug: str
@@ -243,11 +256,20 @@ class ParsedOpenPeriods:
     source_format: TemplateFormat
 
 
+# Enum lookups used inside the row loops; a dict miss is far cheaper than the
+# ValueError raised by calling the enum with an unknown value.
+_KIND_BY_VALUE = {member.value: member for member in StructureOpenPeriodKind}
+_SEASON_BY_VALUE = {member.value: member for member in StructureOpenPeriodSeason}
+_UNIT_BY_VALUE = {member.value: member for member in StructureUnit}
+_WATER_SOURCE_BY_VALUE = {member.value: member for member in WaterSource}
+
+
 def _normalise_text(value: object) -> str:
+    # Called for nearly every cell: test the common str case first.
+    if type(value) is str:
+        return value.strip()
     if value is None:
         return ""
-    if isinstance(value, str):
-        return value.strip()
     return str(value).strip()
 
 
@@ -258,20 +280,16 @@ def _parse_units(value: object) -> tuple[list[StructureUnit] | None, list[str]]:
         text = _normalise_text(value)
         if not text:
             return None, []
-        separators = re.compile(r"[;,]")
-        raw_items = [item for item in separators.split(text) if item]
-    candidates = [
-        _normalise_text(item).upper()
-        for item in raw_items
-        if _normalise_text(item)
-    ]
+        raw_items = text.translate(_LIST_SEP_TRANS).split(",")
+    candidates = [text.upper() for text in map(_normalise_text, raw_items) if text]
     units: list[StructureUnit] = []
     invalid: list[str] = []
     for candidate in candidates:
-        try:
-            units.append(StructureUnit(candidate))
-        except ValueError:
+        unit = _UNIT_BY_VALUE.get(candidate)
+        if unit is None:
             invalid.append(candidate)
+        else:
+            units.append(unit)
     if invalid:
         return None, invalid
     if not units:
@@ -279,72 +297,103 @@ def _parse_units(value: object) -> tuple[list[StructureUnit] | None, list[str]]:
     return units, []
 
 
-def _normalise_decimal(value: object) -> Decimal | None:
+def _try_parse_date(value: object) -> tuple[date | None, str | None]:
+    # XLSX date cells arrive as datetime objects; only text needs parsing.
+    if isinstance(value, datetime):
+        return value.date(), None
+    if isinstance(value, date):
+        return value, None
+    text = _normalise_text(value)
+    if not text:
+        return None, None
+    try:
+        return date.fromisoformat(text), None
+    except ValueError:
+        return None, "Invalid date"
+
+
+@lru_cache(maxsize=64)
+def _invalid_units_message(invalid: tuple[str, ...]) -> str:
+    return f"Invalid units: {', '.join(invalid)}"
+
+
+def _try_normalise_decimal(value: object) -> tuple[Decimal | None, str | None]:
     if value in (None, ""):
-        return None
+        return None, None
     try:
         if isinstance(value, int | float | Decimal):
-            return Decimal(str(value))
-        return Decimal(str(value).strip())
-    except Exception as exc:  # pragma: no cover - defensive
-        raise ValueError("invalid number") from exc
+            return Decimal(str(value)), None
+        return Decimal(str(value).strip()), None
+    except Exception:  # pragma: no cover - defensive
+        return None, "invalid number"
+
+
+# The ``_try_validate_*`` helpers return ``(value, error)`` pairs so the row loops
+# can record problems without raising.
 
 
-def _validate_province(value: str) -> str:
+def _try_validate_province(value: str) -> tuple[str, str | None]:
     if len(value) != 2 or not value.isalpha():
-        raise ValueError("must be 2 letters")
-    return value.upper()
+        return "", "must be 2 letters"
+    return value.upper(), None
 
 
-def _validate_slug(value: str) -> str:
+def _try_validate_slug(value: str) -> tuple[str, str | None]:
     if not value:
-        raise ValueError("cannot be empty")
-    return value
+        return "", "cannot be empty"
+    return value, None
 
 
-def _validate_type(value: str) -> StructureType:
-    try:
-        return StructureType(value.lower())
-    except ValueError as exc:
-        raise ValueError("must be one of house, land, mixed") from exc
+_STRUCTURE_TYPE_BY_VALUE = {member.value: member for member in StructureType}
+
+
+def _try_validate_type(value: str) -> tuple[StructureType, str | None]:
+    structure_type = _STRUCTURE_TYPE_BY_VALUE.get(value.lower())
+    if structure_type is None:
+        return StructureType.HOUSE, "must be one of house, land, mixed"
+    return structure_type, None
 
 
-def _validate_positive_int(value: object, *, allow_empty: bool = True) -> int | None:
+def _try_validate_positive_int(
+    value: object, *, allow_empty: bool = True
+) -> tuple[int | None, str | None]:
     text = _normalise_text(value)
     if not text:
-        return None if allow_empty else 0
+        return (None if allow_empty else 0), None
     try:
         number = int(text)
-    except ValueError as exc:
-        raise ValueError("must be an integer") from exc
+    except ValueError:
+        return None, "must be an integer"
     if number < 0:
-        raise ValueError("must be zero or greater")
-    return number
+        return None, "must be zero or greater"
+    return number, None
 
 
-def _validate_bool(value: object) -> bool | None:
+_TRUTHY_VALUES = frozenset({"true", "1", "yes", "y", "si", "sì"})
+_FALSY_VALUES = frozenset({"false", "0", "no", "n"})
+
+
+def _try_validate_bool(value: object) -> tuple[bool | None, str | None]:
     if isinstance(value, bool):
-        return value
+        return value, None
     text = _normalise_text(value)
     if not text:
-        return None
+        return None, None
     lowered = text.lower()
-    truthy = {"true", "1", "yes", "y", "si", "sì"}
-    falsy = {"false", "0", "no", "n"}
-    if lowered in truthy:
-        return True
-    if lowered in falsy:
-        return False
-    raise ValueError("must be true or false")
-
-
-def _validate_decimal_non_negative(value: object) -> Decimal | None:
-    decimal_value = _normalise_decimal(value)
-    if decimal_value is None:
-        return None
+    if lowered in _TRUTHY_VALUES:
+        return True, None
+    if lowered in _FALSY_VALUES:
+        return False, None
+    return None, "must be true or false"
+
+
+def _try_validate_decimal_non_negative(value: object) -> tuple[Decimal | None, str | None]:
+    decimal_value, error = _try_normalise_decimal(value)
+    if error is not None or decimal_value is None:
+        return None, error
     if decimal_value < Decimal("0"):
-        raise ValueError("must be zero or greater")
-    return decimal_value
+        return None, "must be zero or greater"
+    return decimal_value, None
 
 
 def _parse_water_sources(value: object) -> tuple[list[WaterSource] | None, list[str]]:
@@ -357,20 +406,17 @@ def _parse_water_sources(value: object) -> tuple[list[WaterSource] | None, list[
         text = _normalise_text(value)
         if not text:
             return None, []
-        raw_items = re.split(r"[;,]", text)
+        raw_items = text.translate(_LIST_SEP_TRANS).split(",")
 
-    candidates = [
-        _normalise_text(item).lower()
-        for item in raw_items
-        if _normalise_text(item)
-    ]
+    candidates = [text.lower() for text in map(_normalise_text, raw_items) if text]
     sources: list[WaterSource] = []
     invalid: list[str] = []
     for candidate in candidates:
-        try:
-            sources.append(WaterSource(candidate))
-        except ValueError:
+        source = _WATER_SOURCE_BY_VALUE.get(candidate)
+        if source is None:
             invalid.append(candidate)
+        else:
+            sources.append(source)
     if invalid:
         return None, invalid
     if not sources:
@@ -385,15 +431,18 @@ def _parse_water_sources(value: object) -> tuple[list[WaterSource] | None, list[
     return unique_sources, []
 
 
-def _validate_fire_policy(value: object) -> FirePolicy | None:
+_FIRE_POLICY_BY_VALUE = {member.value: member for member in FirePolicy}
+_FIRE_POLICY_ERROR = f"must be one of {', '.join(item.value for item in FirePolicy)}"
+
+
+def _try_validate_fire_policy(value: object) -> tuple[FirePolicy | None, str | None]:
     text = _normalise_text(value)
     if not text:
-        return None
-    try:
-        return FirePolicy(text.lower())
-    except ValueError as exc:
-        allowed = ", ".join(item.value for item in FirePolicy)
-        raise ValueError(f"must be one of {allowed}") from exc
+        return None, None
+    fire_policy = _FIRE_POLICY_BY_VALUE.get(text.lower())
+    if fire_policy is None:
+        return None, _FIRE_POLICY_ERROR
+    return fire_policy, None
 
 
 def _validate_short_text(value: object, *, max_length: int) -> str | None:
@@ -452,7 +501,7 @@ def _parse_website_urls(value: object) -> tuple[list[str], list[str]]:
         text = _normalise_text(value)
         if not text:
             return [], []
-        raw_items = re.split(r"[\n;]", text)
+        raw_items = text.translate(_URL_SEP_TRANS).split("\n")
 
     urls: list[str] = []
     errors: list[str] = []
@@ -486,7 +535,7 @@ def _parse_contact_emails(value: object) -> tuple[list[str], list[str]]:
         text = _normalise_text(value)
         if not text:
             return [], []
-        raw_items = re.split(r"[\n;,]", text)
+        raw_items = text.translate(_EMAIL_SEP_TRANS).split("\n")
 
     emails: list[str] = []
     errors: list[str] = []
@@ -510,34 +559,209 @@ def _parse_contact_emails(value: object) -> tuple[list[str], list[str]]:
     return emails, errors
 
 
-def _validate_latitude(value: Decimal | None) -> Decimal | None:
-    if value is None:
-        return None
-    if value < Decimal("-90") or value > Decimal("90"):
-        raise ValueError("must be between -90 and 90")
-    return value
+_LATITUDE_RANGE = (Decimal("-90"), Decimal("90"))
+_LONGITUDE_RANGE = (Decimal("-180"), Decimal("180"))
+_ALTITUDE_RANGE = (Decimal("-500"), Decimal("9000"))
 
 
-def _validate_longitude(value: Decimal | None) -> Decimal | None:
-    if value is None:
-        return None
-    if value < Decimal("-180") or value > Decimal("180"):
-        raise ValueError("must be between -180 and 180")
-    return value
+def _try_validate_decimal_range(
+    value: object, bounds: tuple[Decimal, Decimal]
+) -> tuple[Decimal | None, str | None]:
+    decimal_value, error = _try_normalise_decimal(value)
+    if error is not None or decimal_value is None:
+        return None, error
+    lower, upper = bounds
+    if decimal_value < lower or decimal_value > upper:
+        return None, f"must be between {lower} and {upper}"
+    return decimal_value, None
 
 
-def _validate_altitude(value: Decimal | None) -> Decimal | None:
-    if value is None:
+_XLSX_MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_XLSX_REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_XLSX_PACKAGE_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+_XLSX_SHEET_DATA_TAG = f"{_XLSX_MAIN_NS}sheetData"
+_XLSX_ROW_TAG = f"{_XLSX_MAIN_NS}row"
+_XLSX_CELL_TAG = f"{_XLSX_MAIN_NS}c"
+_XLSX_VALUE_TAG = f"{_XLSX_MAIN_NS}v"
+_XLSX_INLINE_STRING_TAG = f"{_XLSX_MAIN_NS}is"
+_XLSX_TEXT_TAG = f"{_XLSX_MAIN_NS}t"
+_XLSX_RUN_TAG = f"{_XLSX_MAIN_NS}r"
+_INVALID_XLSX_MESSAGE = "Invalid XLSX file. Please use the provided template"
+
+
+def _xlsx_text(element: ElementTree.Element) -> str:
+    text = element.findtext(_XLSX_TEXT_TAG)
+    if text is not None:
+        return text
+    return "".join(run.findtext(_XLSX_TEXT_TAG) or "" for run in element.iter(_XLSX_RUN_TAG))
+
+
+@lru_cache(maxsize=256)
+def _xlsx_column_letters_index(letters: str) -> int:
+    column = 0
+    for char in letters:
+        column = column * 26 + ord(char.upper()) - 64
+    return column - 1
+
+
+def _xlsx_column_index(reference: str) -> int:
+    return _xlsx_column_letters_index(reference.rstrip("0123456789"))
+
+
+def _xlsx_relationships(archive: zipfile.ZipFile, part: str) -> dict[str, tuple[str, str]]:
+    directory, name = posixpath.split(part)
+    rels_path = posixpath.join(directory, "_rels", f"{name}.rels")
+    try:
+        root = SafeElementTree.fromstring(archive.read(rels_path))
+    except KeyError:
+        return {}
+    relationships: dict[str, tuple[str, str]] = {}
+    for rel in root.iter(f"{_XLSX_PACKAGE_REL_NS}Relationship"):
+        target = rel.get("Target", "")
+        if target.startswith("/"):
+            target = target.lstrip("/")
+        else:
+            target = posixpath.normpath(posixpath.join(directory, target))
+        relationships[rel.get("Id", "")] = (rel.get("Type", ""), target)
+    return relationships
+
+
+def _xlsx_date_styles(archive: zipfile.ZipFile, path: str | None) -> dict[int, bool]:
+    """Map style ids using a date format to whether they hold a timedelta."""
+
+    if path is None or path not in archive.NameToInfo:
+        return {}
+    root = SafeElementTree.fromstring(archive.read(path))
+    custom_formats = {
+        int(fmt.get("numFmtId", "0")): fmt.get("formatCode", "")
+        for fmt in root.iter(f"{_XLSX_MAIN_NS}numFmt")
+    }
+    cell_xfs = root.find(f"{_XLSX_MAIN_NS}cellXfs")
+    if cell_xfs is None:
+        return {}
+    date_styles: dict[int, bool] = {}
+    for style_id, xf in enumerate(cell_xfs.iter(f"{_XLSX_MAIN_NS}xf")):
+        format_id = int(xf.get("numFmtId", "0"))
+        format_code = custom_formats.get(format_id) or BUILTIN_FORMATS.get(format_id)
+        if format_code and is_date_format(format_code):
+            date_styles[style_id] = is_timedelta_format(format_code)
+    return date_styles
+
+
+def _xlsx_cell_value(
+    cell: ElementTree.Element,
+    shared_strings: list[str],
+    date_styles: dict[int, bool],
+    epoch: object,
+) -> object:
+    data_type = cell.get("t", "n")
+    if data_type == "inlineStr":
+        inline = cell.find(_XLSX_INLINE_STRING_TAG)
+        return _xlsx_text(inline) if inline is not None else None
+
+    raw = cell.findtext(_XLSX_VALUE_TAG) or None
+    if raw is None:
         return None
-    if value < Decimal("-500") or value > Decimal("9000"):
-        raise ValueError("must be between -500 and 9000")
-    return value
+    if data_type == "n":
+        number: int | float = float(raw) if "." in raw or "e" in raw or "E" in raw else int(raw)
+        style = cell.get("s")
+        if style and int(style) in date_styles:
+            try:
+                return from_excel(number, epoch, timedelta=date_styles[int(style)])
+            except (OverflowError, ValueError):
+                return "#VALUE!"
+        return number
+    if data_type == "s":
+        return shared_strings[int(raw)]
+    if data_type == "b":
+        return bool(int(raw))
+    if data_type == "d":
+        return from_ISO8601(raw)
+    return raw
+
+
+def _iter_xlsx_rows(data: bytes) -> Iterator[tuple[int, tuple[object, ...]]]:
+    """Stream ``(row_number, values)`` pairs from the active sheet of an XLSX file.
+
+    The worksheet XML is read with ``iterparse`` and every row is discarded once
+    yielded, so memory stays flat regardless of the sheet size. Values follow
+    openpyxl's ``values_only`` conventions and rows missing from the XML are
+    yielded as empty tuples to keep row numbers aligned with the spreadsheet.
+    """
+
+    try:
+        archive = zipfile.ZipFile(BytesIO(data))
+    except zipfile.BadZipFile as exc:
+        raise ValueError(_INVALID_XLSX_MESSAGE) from exc
+
+    with archive:
+        try:
+            workbook = SafeElementTree.fromstring(archive.read("xl/workbook.xml"))
+            relationships = _xlsx_relationships(archive, "xl/workbook.xml")
+
+            sheets = workbook.findall(f"{_XLSX_MAIN_NS}sheets/{_XLSX_MAIN_NS}sheet")
+            view = workbook.find(f"{_XLSX_MAIN_NS}bookViews/{_XLSX_MAIN_NS}workbookView")
+            active_tab = int(view.get("activeTab", "0")) if view is not None else 0
+            if not sheets:
+                raise ValueError(_INVALID_XLSX_MESSAGE)
+            sheet = sheets[active_tab] if active_tab < len(sheets) else sheets[0]
+            sheet_path = relationships[sheet.get(f"{_XLSX_REL_NS}id", "")][1]
+
+            targets = {kind.rsplit("/", 1)[-1]: target for kind, target in relationships.values()}
+            shared_strings: list[str] = []
+            strings_path = targets.get("sharedStrings")
+            if strings_path is not None and strings_path in archive.NameToInfo:
+                strings_root = SafeElementTree.fromstring(archive.read(strings_path))
+                shared_strings = [
+                    _xlsx_text(item) for item in strings_root.iter(f"{_XLSX_MAIN_NS}si")
+                ]
+            date_styles = _xlsx_date_styles(archive, targets.get("styles"))
+
+            properties = workbook.find(f"{_XLSX_MAIN_NS}workbookPr")
+            date1904 = properties is not None and properties.get("date1904") in {"1", "true"}
+            epoch = CALENDAR_MAC_1904 if date1904 else WINDOWS_EPOCH
+
+            with archive.open(sheet_path) as source:
+                sheet_data: ElementTree.Element | None = None
+                expected_row = 1
+                for event, element in SafeElementTree.iterparse(source, events=("start", "end")):
+                    if event == "start":
+                        if element.tag == _XLSX_SHEET_DATA_TAG:
+                            sheet_data = element
+                        continue
+                    if element.tag != _XLSX_ROW_TAG:
+                        continue
+
+                    row_number = int(element.get("r") or expected_row)
+                    while expected_row < row_number:
+                        yield expected_row, ()
+                        expected_row += 1
+
+                    values: list[object] = []
+                    for cell in element.iterfind(_XLSX_CELL_TAG):
+                        reference = cell.get("r")
+                        if reference:
+                            column = _xlsx_column_index(reference)
+                            if column > len(values):
+                                values.extend([None] * (column - len(values)))
+                        values.append(_xlsx_cell_value(cell, shared_strings, date_styles, epoch))
+
+                    if sheet_data is not None:
+                        sheet_data.clear()
+                    else:
+                        element.clear()
+                    yield row_number, tuple(values)
+                    expected_row = row_number + 1
+        except (KeyError, IndexError, ElementTree.ParseError, DefusedXmlException) as exc:
+            raise ValueError(_INVALID_XLSX_MESSAGE) from exc
 
 
 def _is_blank_row(values: Sequence[object]) -> bool:
     for value in values:
-        text = _normalise_text(value)
-        if text:
+        # Empty cells are settled without a call; only other values need normalising.
+        if value is None or value == "":
+            continue
+        if _normalise_text(value):
             return False
     return True
 
@@ -575,232 +799,129 @@ def _process_rows(
     seen_slugs: dict[str, int] = {}
     blank_rows = 0
 
-    for index, raw_values in rows:
-        values = list(raw_values)
-        if len(values) < len(HEADERS):
-            values.extend([None] * (len(HEADERS) - len(values)))
-        else:
-            values = values[: len(HEADERS)]
+    column_count = len(HEADERS)
 
+    for index, raw_values in rows:
+        values = raw_values
+        if len(values) > column_count:
+            values = values[:column_count]
         if _is_blank_row(values):
             blank_rows += 1
             continue
 
         processed_rows += 1
         if processed_rows > max_rows:
-            raise ValueError(f"Too many rows. Maximum allowed is {max_rows}")
-
-        name_value = values[0]
-        slug_value = values[1]
-        province_value = values[2]
-        address_value = values[3]
-        latitude_raw = values[4]
-        longitude_raw = values[5]
-        altitude_raw = values[6]
-        type_raw = values[7]
-        indoor_beds_raw = values[8]
-        indoor_bathrooms_raw = values[9]
-        indoor_showers_raw = values[10]
-        indoor_activity_rooms_raw = values[11]
-        has_kitchen_raw = values[12]
-        hot_water_raw = values[13]
-        land_area_raw = values[14]
-        shelter_on_field_raw = values[15]
-        water_sources_raw = values[16]
-        electricity_available_raw = values[17]
-        fire_policy_raw = values[18]
-        access_by_car_raw = values[19]
-        access_by_coach_raw = values[20]
-        access_by_public_transport_raw = values[21]
-        coach_turning_area_raw = values[22]
-        transport_access_points_raw = values[23]
-        weekend_only_raw = values[24]
-        has_field_poles_raw = values[25]
-        pit_latrine_allowed_raw = values[26]
-        contact_emails_raw = values[27]
-        website_urls_raw = values[28]
-        notes_logistics_raw = values[29]
-        notes_raw = values[30]
-
-        row_errors: list[RowError] = []
-        row_warnings: list[RowError] = []
+            # Stop consuming the source so streaming readers don't parse the rest.
+            break
+
+        # Well-formed rows (the common CSV and JSON case) are used as-is, without a copy.
+        if len(values) < column_count:
+            values = [*values, *([None] * (column_count - len(values)))]
+
+        (
+            name_value,
+            slug_value,
+            province_value,
+            address_value,
+            latitude_raw,
+            longitude_raw,
+            altitude_raw,
+            type_raw,
+            indoor_beds_raw,
+            indoor_bathrooms_raw,
+            indoor_showers_raw,
+            indoor_activity_rooms_raw,
+            has_kitchen_raw,
+            hot_water_raw,
+            land_area_raw,
+            shelter_on_field_raw,
+            water_sources_raw,
+            electricity_available_raw,
+            fire_policy_raw,
+            access_by_car_raw,
+            access_by_coach_raw,
+            access_by_public_transport_raw,
+            coach_turning_area_raw,
+            transport_access_points_raw,
+            weekend_only_raw,
+            has_field_poles_raw,
+            pit_latrine_allowed_raw,
+            contact_emails_raw,
+            website_urls_raw,
+            notes_logistics_raw,
+            notes_raw,
+        ) = values
+
+        # (field, message) pairs; RowError instances are only built when flushing.
+        row_errors: list[tuple[str, str]] = []
+        row_warnings: list[tuple[str, str]] = []
 
         name = _normalise_text(name_value)
         if not name:
-            row_errors.append(
-                RowError(
-                    row=index, field="name", message="cannot be empty", source_format=source_format
-                )
-            )
+            row_errors.append(("name", "cannot be empty"))
 
-        try:
-            slug = _validate_slug(_normalise_text(slug_value))
-        except ValueError as exc:
-            row_errors.append(
-                RowError(row=index, field="slug", message=str(exc), source_format=source_format)
-            )
-            slug = ""
-        try:
-            province = _validate_province(_normalise_text(province_value))
-        except ValueError as exc:
-            row_errors.append(
-                RowError(row=index, field="province", message=str(exc), source_format=source_format)
-            )
-            province = ""
+        slug, error = _try_validate_slug(_normalise_text(slug_value))
+        if error is not None:
+            row_errors.append(("slug", error))
+        province, error = _try_validate_province(_normalise_text(province_value))
+        if error is not None:
+            row_errors.append(("province", error))
 
         address = _normalise_text(address_value) or None
 
-        try:
-            latitude = _validate_latitude(_normalise_decimal(latitude_raw))
-        except ValueError as exc:
-            row_errors.append(
-                RowError(row=index, field="latitude", message=str(exc), source_format=source_format)
-            )
-            latitude = None
+        latitude, error = _try_validate_decimal_range(latitude_raw, _LATITUDE_RANGE)
+        if error is not None:
+            row_errors.append(("latitude", error))
 
-        try:
-            longitude = _validate_longitude(_normalise_decimal(longitude_raw))
-        except ValueError as exc:
-            row_errors.append(
-                RowError(
-                    row=index,
-                    field="longitude",
-                    message=str(exc),
-                    source_format=source_format,
-                )
-            )
-            longitude = None
+        longitude, error = _try_validate_decimal_range(longitude_raw, _LONGITUDE_RANGE)
+        if error is not None:
+            row_errors.append(("longitude", error))
 
-        try:
-            altitude = _validate_altitude(_normalise_decimal(altitude_raw))
-        except ValueError as exc:
-            row_errors.append(
-                RowError(row=index, field="altitude", message=str(exc), source_format=source_format)
-            )
-            altitude = None
+        altitude, error = _try_validate_decimal_range(altitude_raw, _ALTITUDE_RANGE)
+        if error is not None:
+            row_errors.append(("altitude", error))
 
-        try:
-            structure_type = _validate_type(_normalise_text(type_raw))
-        except ValueError as exc:
-            row_errors.append(
-                RowError(row=index, field="type", message=str(exc), source_format=source_format)
-            )
-            structure_type = StructureType.HOUSE
+        structure_type, error = _try_validate_type(_normalise_text(type_raw))
+        if error is not None:
+            row_errors.append(("type", error))
 
-        try:
-            indoor_beds = _validate_positive_int(indoor_beds_raw)
-        except ValueError as exc:
-            row_errors.append(
-                RowError(
-                    row=index,
-                    field="indoor_beds",
-                    message=str(exc),
-                    source_format=source_format,
-                )
-            )
-            indoor_beds = None
+        indoor_beds, error = _try_validate_positive_int(indoor_beds_raw)
+        if error is not None:
+            row_errors.append(("indoor_beds", error))
 
-        try:
-            indoor_bathrooms = _validate_positive_int(indoor_bathrooms_raw)
-        except ValueError as exc:
-            row_errors.append(
-                RowError(
-                    row=index,
-                    field="indoor_bathrooms",
-                    message=str(exc),
-                    source_format=source_format,
-                )
-            )
-            indoor_bathrooms = None
+        indoor_bathrooms, error = _try_validate_positive_int(indoor_bathrooms_raw)
+        if error is not None:
+            row_errors.append(("indoor_bathrooms", error))
 
-        try:
-            indoor_showers = _validate_positive_int(indoor_showers_raw)
-        except ValueError as exc:
-            row_errors.append(
-                RowError(
-                    row=index,
-                    field="indoor_showers",
-                    message=str(exc),
-                    source_format=source_format,
-                )
-            )
-            indoor_showers = None
+        indoor_showers, error = _try_validate_positive_int(indoor_showers_raw)
+        if error is not None:
+            row_errors.append(("indoor_showers", error))
 
-        try:
-            indoor_activity_rooms = _validate_positive_int(indoor_activity_rooms_raw)
-        except ValueError as exc:
-            row_errors.append(
-                RowError(
-                    row=index,
-                    field="indoor_activity_rooms",
-                    message=str(exc),
-                    source_format=source_format,
-                )
-            )
-            indoor_activity_rooms = None
+        indoor_activity_rooms, error = _try_validate_positive_int(indoor_activity_rooms_raw)
+        if error is not None:
+            row_errors.append(("indoor_activity_rooms", error))
 
-        try:
-            has_kitchen = _validate_bool(has_kitchen_raw)
-        except ValueError as exc:
-            row_errors.append(
-                RowError(
-                    row=index,
-                    field="has_kitchen",
-                    message=str(exc),
-                    source_format=source_format,
-                )
-            )
-            has_kitchen = None
+        has_kitchen, error = _try_validate_bool(has_kitchen_raw)
+        if error is not None:
+            row_errors.append(("has_kitchen", error))
 
-        try:
-            hot_water = _validate_bool(hot_water_raw)
-        except ValueError as exc:
-            row_errors.append(
-                RowError(
-                    row=index,
-                    field="hot_water",
-                    message=str(exc),
-                    source_format=source_format,
-                )
-            )
-            hot_water = None
+        hot_water, error = _try_validate_bool(hot_water_raw)
+        if error is not None:
+            row_errors.append(("hot_water", error))
 
-        try:
-            land_area_m2 = _validate_decimal_non_negative(land_area_raw)
-        except ValueError as exc:
-            row_errors.append(
-                RowError(
-                    row=index,
-                    field="land_area_m2",
-                    message=str(exc),
-                    source_format=source_format,
-                )
-            )
-            land_area_m2 = None
+        land_area_m2, error = _try_validate_decimal_non_negative(land_area_raw)
+        if error is not None:
+            row_errors.append(("land_area_m2", error))
 
-        try:
-            shelter_on_field = _validate_bool(shelter_on_field_raw)
-        except ValueError as exc:
-            row_errors.append(
-                RowError(
-                    row=index,
-                    field="shelter_on_field",
-                    message=str(exc),
-                    source_format=source_format,
-                )
-            )
-            shelter_on_field = None
+        shelter_on_field, error = _try_validate_bool(shelter_on_field_raw)
+        if error is not None:
+            row_errors.append(("shelter_on_field", error))
 
         water_sources_list, water_sources_invalid = _parse_water_sources(water_sources_raw)
         water_sources: list[WaterSource] | None
         if water_sources_invalid:
             row_errors.append(
-                RowError(
-                    row=index,
-                    field="water_sources",
-                    message=f"Invalid values: {', '.join(water_sources_invalid)}",
-                    source_format=source_format,
-                )
+                ("water_sources", f"Invalid values: {', '.join(water_sources_invalid)}")
             )
             water_sources = None
         else:
@@ -814,244 +935,119 @@ def _process_rows(
                     joined = ", ".join(f"'{item.value}'" for item in selected_exclusive)
                     prefix = "Values" if len(selected_exclusive) > 1 else "Value"
                     row_errors.append(
-                        RowError(
-                            row=index,
-                            field="water_sources",
-                            message=f"{prefix} {joined} cannot be combined with other entries",
-                            source_format=source_format,
+                        (
+                            "water_sources",
+                            f"{prefix} {joined} cannot be combined with other entries",
                         )
                     )
 
-        try:
-            electricity_available = _validate_bool(electricity_available_raw)
-        except ValueError as exc:
-            row_errors.append(
-                RowError(
-                    row=index,
-                    field="electricity_available",
-                    message=str(exc),
-                    source_format=source_format,
-                )
-            )
-            electricity_available = None
+        electricity_available, error = _try_validate_bool(electricity_available_raw)
+        if error is not None:
+            row_errors.append(("electricity_available", error))
 
-        try:
-            fire_policy = _validate_fire_policy(fire_policy_raw)
-        except ValueError as exc:
-            row_errors.append(
-                RowError(
-                    row=index,
-                    field="fire_policy",
-                    message=str(exc),
-                    source_format=source_format,
-                )
-            )
-            fire_policy = None
+        fire_policy, error = _try_validate_fire_policy(fire_policy_raw)
+        if error is not None:
+            row_errors.append(("fire_policy", error))
 
-        try:
-            access_by_car = _validate_bool(access_by_car_raw)
-        except ValueError as exc:
-            row_errors.append(
-                RowError(
-                    row=index,
-                    field="access_by_car",
-                    message=str(exc),
-                    source_format=source_format,
-                )
-            )
-            access_by_car = None
+        access_by_car, error = _try_validate_bool(access_by_car_raw)
+        if error is not None:
+            row_errors.append(("access_by_car", error))
 
-        try:
-            access_by_coach = _validate_bool(access_by_coach_raw)
-        except ValueError as exc:
-            row_errors.append(
-                RowError(
-                    row=index,
-                    field="access_by_coach",
-                    message=str(exc),
-                    source_format=source_format,
-                )
-            )
-            access_by_coach = None
+        access_by_coach, error = _try_validate_bool(access_by_coach_raw)
+        if error is not None:
+            row_errors.append(("access_by_coach", error))
 
-        try:
-            access_by_public_transport = _validate_bool(access_by_public_transport_raw)
-        except ValueError as exc:
-            row_errors.append(
-                RowError(
-                    row=index,
-                    field="access_by_public_transport",
-                    message=str(exc),
-                    source_format=source_format,
-                )
-            )
-            access_by_public_transport = None
+        access_by_public_transport, error = _try_validate_bool(access_by_public_transport_raw)
+        if error is not None:
+            row_errors.append(("access_by_public_transport", error))
 
-        try:
-            coach_turning_area = _validate_bool(coach_turning_area_raw)
-        except ValueError as exc:
-            row_errors.append(
-                RowError(
-                    row=index,
-                    field="coach_turning_area",
-                    message=str(exc),
-                    source_format=source_format,
-                )
-            )
-            coach_turning_area = None
+        coach_turning_area, error = _try_validate_bool(coach_turning_area_raw)
+        if error is not None:
+            row_errors.append(("coach_turning_area", error))
 
         try:
             transport_access_points = _parse_transport_access_points(
                 transport_access_points_raw
             )
         except ValueError as exc:
-            row_errors.append(
-                RowError(
-                    row=index,
-                    field="transport_access_points",
-                    message=str(exc),
-                    source_format=source_format,
-                )
-            )
+            row_errors.append(("transport_access_points", str(exc)))
             transport_access_points = None
 
-        try:
-            weekend_only = _validate_bool(weekend_only_raw)
-        except ValueError as exc:
-            row_errors.append(
-                RowError(
-                    row=index,
-                    field="weekend_only",
-                    message=str(exc),
-                    source_format=source_format,
-                )
-            )
-            weekend_only = None
+        weekend_only, error = _try_validate_bool(weekend_only_raw)
+        if error is not None:
+            row_errors.append(("weekend_only", error))
 
-        try:
-            has_field_poles = _validate_bool(has_field_poles_raw)
-        except ValueError as exc:
-            row_errors.append(
-                RowError(
-                    row=index,
-                    field="has_field_poles",
-                    message=str(exc),
-                    source_format=source_format,
-                )
-            )
-            has_field_poles = None
+        has_field_poles, error = _try_validate_bool(has_field_poles_raw)
+        if error is not None:
+            row_errors.append(("has_field_poles", error))
 
-        try:
-            pit_latrine_allowed = _validate_bool(pit_latrine_allowed_raw)
-        except ValueError as exc:
-            row_errors.append(
-                RowError(
-                    row=index,
-                    field="pit_latrine_allowed",
-                    message=str(exc),
-                    source_format=source_format,
-                )
-            )
-            pit_latrine_allowed = None
+        pit_latrine_allowed, error = _try_validate_bool(pit_latrine_allowed_raw)
+        if error is not None:
+            row_errors.append(("pit_latrine_allowed", error))
 
         contact_emails, email_errors = _parse_contact_emails(contact_emails_raw)
         for message in email_errors:
-            row_errors.append(
-                RowError(
-                    row=index,
-                    field="contact_emails",
-                    message=message,
-                    source_format=source_format,
-                )
-            )
+            row_errors.append(("contact_emails", message))
 
         website_urls, url_errors = _parse_website_urls(website_urls_raw)
         for message in url_errors:
-            row_errors.append(
-                RowError(
-                    row=index,
-                    field="website_urls",
-                    message=message,
-                    source_format=source_format,
-                )
-            )
+            row_errors.append(("website_urls", message))
 
         notes_logistics = _normalise_text(notes_logistics_raw) or None
         notes = _normalise_text(notes_raw) or None
 
-        def _warn(
-            field: str,
-            message: str,
-            *,
-            _warnings=row_warnings,
-            _row=index,
-        ) -> None:
-            _warnings.append(
-                RowError(
-                    row=_row,
-                    field=field,
-                    message=message,
-                    source_format=source_format,
-                )
-            )
-
         if structure_type == StructureType.HOUSE:
             if land_area_m2 is not None:
-                _warn("land_area_m2", "Ignored for type=house")
+                row_warnings.append(("land_area_m2", "Ignored for type=house"))
                 land_area_m2 = None
             if shelter_on_field:
-                _warn("shelter_on_field", "Ignored for type=house")
+                row_warnings.append(("shelter_on_field", "Ignored for type=house"))
                 shelter_on_field = None
             if water_sources:
-                _warn("water_sources", "Ignored for type=house")
+                row_warnings.append(("water_sources", "Ignored for type=house"))
                 water_sources = None
             if electricity_available:
-                _warn("electricity_available", "Ignored for type=house")
+                row_warnings.append(("electricity_available", "Ignored for type=house"))
                 electricity_available = None
             if fire_policy is not None:
-                _warn("fire_policy", "Ignored for type=house")
+                row_warnings.append(("fire_policy", "Ignored for type=house"))
                 fire_policy = None
             if has_field_poles:
-                _warn("has_field_poles", "Ignored for type=house")
+                row_warnings.append(("has_field_poles", "Ignored for type=house"))
                 has_field_poles = None
             if pit_latrine_allowed:
-                _warn("pit_latrine_allowed", "Ignored for type=house")
+                row_warnings.append(("pit_latrine_allowed", "Ignored for type=house"))
                 pit_latrine_allowed = None
 
         if structure_type == StructureType.LAND:
             if indoor_beds is not None:
-                _warn("indoor_beds", "Ignored for type=land")
+                row_warnings.append(("indoor_beds", "Ignored for type=land"))
                 indoor_beds = None
             if indoor_bathrooms is not None:
-                _warn("indoor_bathrooms", "Ignored for type=land")
+                row_warnings.append(("indoor_bathrooms", "Ignored for type=land"))
                 indoor_bathrooms = None
             if indoor_showers is not None:
-                _warn("indoor_showers", "Ignored for type=land")
+                row_warnings.append(("indoor_showers", "Ignored for type=land"))
                 indoor_showers = None
             if indoor_activity_rooms is not None:
-                _warn("indoor_activity_rooms", "Ignored for type=land")
+                row_warnings.append(("indoor_activity_rooms", "Ignored for type=land"))
                 indoor_activity_rooms = None
             if has_kitchen:
-                _warn("has_kitchen", "Ignored for type=land")
+                row_warnings.append(("has_kitchen", "Ignored for type=land"))
                 has_kitchen = None
             if hot_water:
-                _warn("hot_water", "Ignored for type=land")
+                row_warnings.append(("hot_water", "Ignored for type=land"))
                 hot_water = None
 
         if slug and slug in seen_slugs:
-            row_errors.append(
-                RowError(
-                    row=index,
-                    field="slug",
-                    message="duplicate slug in file",
-                    source_format=source_format,
-                )
-            )
+            row_errors.append(("slug", "duplicate slug in file"))
         elif slug:
             seen_slugs[slug] = index
 
-        errors.extend(row_errors)
         if row_errors:
+            errors.extend(
+                RowError(index, field, message, source_format) for field, message in row_errors
+            )
             continue
 
         stored_rows.append(
@@ -1090,7 +1086,12 @@ def _process_rows(
                 notes=notes,
             )
         )
-        errors.extend(row_warnings)
+        errors.extend(
+            RowError(index, field, message, source_format) for field, message in row_warnings
+        )
+
+    if processed_rows > max_rows:
+        raise ValueError(f"Too many rows. Maximum allowed is {max_rows}")
 
     return ParsedWorkbook(
         rows=stored_rows,
@@ -1111,170 +1112,110 @@ def _process_open_period_rows(
     errors: list[RowError] = []
     blank_rows = 0
 
-    for index, raw_values in rows:
-        values = list(raw_values)
-        if len(values) < len(OPEN_PERIOD_HEADERS):
-            values.extend([None] * (len(OPEN_PERIOD_HEADERS) - len(values)))
-        else:
-            values = values[: len(OPEN_PERIOD_HEADERS)]
+    column_count = len(OPEN_PERIOD_HEADERS)
 
+    for index, raw_values in rows:
+        values = raw_values
+        if len(values) > column_count:
+            values = values[:column_count]
         if _is_blank_row(values):
             blank_rows += 1
             continue
 
         processed_rows += 1
         if processed_rows > max_rows:
-            raise ValueError(f"Too many rows. Maximum allowed is {max_rows}")
+            # Stop consuming the source so streaming readers don't parse the rest.
+            break
+
+        # Well-formed rows (the common CSV and JSON case) are used as-is, without a copy.
+        if len(values) < column_count:
+            values = [*values, *([None] * (column_count - len(values)))]
 
         slug_raw, kind_raw, season_raw, units_raw, date_start_raw, date_end_raw, notes_raw = values
 
-        row_errors: list[RowError] = []
+        errors_before = len(errors)
 
-        try:
-            structure_slug = _validate_slug(_normalise_text(slug_raw))
-        except ValueError as exc:
-            row_errors.append(
-                RowError(
-                    row=index,
-                    field="structure_slug",
-                    message=str(exc),
-                    source_format=source_format,
-                )
-            )
-            structure_slug = ""
+        # Open periods repeat the same few slugs; share one string per slug.
+        structure_slug, error = _try_validate_slug(sys.intern(_normalise_text(slug_raw)))
+        if error is not None:
+            errors.append(RowError(index, "structure_slug", error, source_format))
 
         kind_text = _normalise_text(kind_raw).lower()
-        try:
-            kind = StructureOpenPeriodKind(kind_text)
-        except ValueError:
-            row_errors.append(
-                RowError(
-                    row=index,
-                    field="kind",
-                    message="must be 'season' or 'range'",
-                    source_format=source_format,
-                )
-            )
+        kind = _KIND_BY_VALUE.get(kind_text)
+        if kind is None:
+            errors.append(RowError(index, "kind", "must be 'season' or 'range'", source_format))
             kind = StructureOpenPeriodKind.SEASON
 
         season: StructureOpenPeriodSeason | None = None
         units: list[StructureUnit] | None = None
-        date_start: date | None = None
-        date_end: date | None = None
 
         season_text = _normalise_text(season_raw).lower()
         if season_text:
-            try:
-                season = StructureOpenPeriodSeason(season_text)
-            except ValueError as exc:
-                row_errors.append(
+            season = _SEASON_BY_VALUE.get(season_text)
+            if season is None:
+                errors.append(
                     RowError(
-                        row=index,
-                        field="season",
-                        message=str(exc),
-                        source_format=source_format,
+                        index,
+                        "season",
+                        f"{season_text!r} is not a valid StructureOpenPeriodSeason",
+                        source_format,
                     )
                 )
-                season = None
 
         units_parsed, unit_errors = _parse_units(units_raw)
         if unit_errors:
-            row_errors.append(
-                RowError(
-                    row=index,
-                    field="units",
-                    message=f"Invalid units: {', '.join(unit_errors)}",
-                    source_format=source_format,
-                )
+            errors.append(
+                RowError(index, "units", _invalid_units_message(tuple(unit_errors)), source_format)
             )
         else:
             units = units_parsed
 
-        date_start_text = _normalise_text(date_start_raw)
-        if date_start_text:
-            try:
-                date_start = date.fromisoformat(date_start_text)
-            except ValueError:
-                row_errors.append(
-                    RowError(
-                        row=index,
-                        field="date_start",
-                        message="Invalid date",
-                        source_format=source_format,
-                    )
-                )
-                date_start = None
+        date_start, error = _try_parse_date(date_start_raw)
+        if error is not None:
+            errors.append(RowError(index, "date_start", error, source_format))
 
-        date_end_text = _normalise_text(date_end_raw)
-        if date_end_text:
-            try:
-                date_end = date.fromisoformat(date_end_text)
-            except ValueError:
-                row_errors.append(
-                    RowError(
-                        row=index,
-                        field="date_end",
-                        message="Invalid date",
-                        source_format=source_format,
-                    )
-                )
-                date_end = None
+        date_end, error = _try_parse_date(date_end_raw)
+        if error is not None:
+            errors.append(RowError(index, "date_end", error, source_format))
 
         if kind is StructureOpenPeriodKind.SEASON:
             if season is None:
-                row_errors.append(
-                    RowError(
-                        row=index,
-                        field="season",
-                        message="Season is required for kind=season",
-                        source_format=source_format,
-                    )
+                errors.append(
+                    RowError(index, "season", "Season is required for kind=season", source_format)
                 )
             if date_start is not None or date_end is not None:
-                row_errors.append(
+                errors.append(
                     RowError(
-                        row=index,
-                        field="date_start",
-                        message="Dates must be empty for kind=season",
-                        source_format=source_format,
+                        index, "date_start", "Dates must be empty for kind=season", source_format
                     )
                 )
                 date_start = None
                 date_end = None
         else:  # range
             if season is not None:
-                row_errors.append(
-                    RowError(
-                        row=index,
-                        field="season",
-                        message="Season must be empty for kind=range",
-                        source_format=source_format,
-                    )
+                errors.append(
+                    RowError(index, "season", "Season must be empty for kind=range", source_format)
                 )
                 season = None
             if date_start is None or date_end is None:
-                row_errors.append(
+                errors.append(
                     RowError(
-                        row=index,
-                        field="date_start",
-                        message="Both date_start and date_end are required for kind=range",
-                        source_format=source_format,
+                        index,
+                        "date_start",
+                        "Both date_start and date_end are required for kind=range",
+                        source_format,
                     )
                 )
             elif date_start > date_end:
-                row_errors.append(
+                errors.append(
                     RowError(
-                        row=index,
-                        field="date_start",
-                        message="date_start cannot be after date_end",
-                        source_format=source_format,
+                        index, "date_start", "date_start cannot be after date_end", source_format
                     )
                 )
 
         notes = _normalise_text(notes_raw) or None
 
-        errors.extend(row_errors)
-        if row_errors:
+        if len(errors) > errors_before:
             continue
 
         stored_rows.append(
@@ -1290,6 +1231,9 @@ def _process_open_period_rows(
             )
         )
 
+    if processed_rows > max_rows:
+        raise ValueError(f"Too many rows. Maximum allowed is {max_rows}")
+
     return ParsedOpenPeriods(
         rows=stored_rows,
         errors=errors,
@@ -1302,11 +1246,10 @@ def parse_structures_xlsx(data: bytes, *, max_rows: int = 2000) -> ParsedWorkboo
     if not data:
         raise ValueError("The uploaded file is empty")
 
-    workbook = load_workbook(BytesIO(data), data_only=True, read_only=True)
+    rows = _iter_xlsx_rows(data)
     try:
-        sheet = workbook.active
         try:
-            header_row = next(sheet.iter_rows(max_row=1, values_only=True))
+            _, header_row = next(rows)
         except StopIteration as exc:
             raise ValueError("The uploaded file is empty") from exc
 
@@ -1314,47 +1257,35 @@ def parse_structures_xlsx(data: bytes, *, max_rows: int = 2000) -> ParsedWorkboo
         if [item.strip() for item in header] != HEADERS:
             raise ValueError("Invalid header. Please use the provided template")
 
-        rows = _process_rows(
-            (
-                (index, tuple(row or tuple()))
-                for index, row in enumerate(
-                    sheet.iter_rows(min_row=2, values_only=True),
-                    start=2,
-                )
-            ),
-            source_format="xlsx",
-            max_rows=max_rows,
-        )
-        return rows
+        return _process_rows(rows, source_format="xlsx", max_rows=max_rows)
     finally:
-        workbook.close()
+        rows.close()
 
 
 def parse_structures_csv(data: bytes, *, max_rows: int = 2000) -> ParsedWorkbook:
     if not data:
         raise ValueError("The uploaded file is empty")
 
-    try:
-        text = data.decode("utf-8-sig")
-    except UnicodeDecodeError as exc:
-        raise ValueError("CSV must be UTF-8 encoded") from exc
-
-    buffer = StringIO(text)
+    # Decode lazily as csv.reader pulls lines instead of holding a decoded copy of the file.
+    buffer = TextIOWrapper(BytesIO(data), encoding="utf-8-sig", newline="")
     reader = csv.reader(buffer, delimiter=",")
 
     try:
-        header = next(reader)
-    except StopIteration as exc:
-        raise ValueError("The uploaded file is empty") from exc
+        try:
+            header = next(reader)
+        except StopIteration as exc:
+            raise ValueError("The uploaded file is empty") from exc
 
-    if [item.strip() for item in header] != HEADERS:
-        raise ValueError("Invalid header. Please use the provided template")
+        if [item.strip() for item in header] != HEADERS:
+            raise ValueError("Invalid header. Please use the provided template")
 
-    return _process_rows(
-        ((index, row) for index, row in enumerate(reader, start=2)),
-        source_format="csv",
-        max_rows=max_rows,
-    )
+        return _process_rows(
+            enumerate(reader, start=2),
+            source_format="csv",
+            max_rows=max_rows,
+        )
+    except UnicodeDecodeError as exc:
+        raise ValueError("CSV must be UTF-8 encoded") from exc
 
 
 def parse_structures_json(data: bytes, *, max_rows: int = 2000) -> ParsedWorkbook:
@@ -1395,11 +1326,10 @@ def parse_structure_open_periods_xlsx(
     if not data:
         raise ValueError("The uploaded file is empty")
 
-    workbook = load_workbook(BytesIO(data), data_only=True, read_only=True)
+    rows = _iter_xlsx_rows(data)
     try:
-        sheet = workbook.active
         try:
-            header_row = next(sheet.iter_rows(max_row=1, values_only=True))
+            _, header_row = next(rows)
         except StopIteration as exc:
             raise ValueError("The uploaded file is empty") from exc
 
@@ -1407,20 +1337,9 @@ def parse_structure_open_periods_xlsx(
         if [item.strip() for item in header] != OPEN_PERIOD_HEADERS:
             raise ValueError("Invalid header. Please use the provided template")
 
-        rows = _process_open_period_rows(
-            (
-                (
-                    index,
-                    tuple(row or tuple()),
-                )
-                for index, row in enumerate(sheet.iter_rows(min_row=2, values_only=True), start=2)
-            ),
-            source_format="xlsx",
-            max_rows=max_rows,
-        )
-        return rows
+        return _process_open_period_rows(rows, source_format="xlsx", max_rows=max_rows)
     finally:
-        workbook.close()
+        rows.close()
 
 
 def parse_structure_open_periods_csv(
@@ -1431,27 +1350,25 @@ def parse_structure_open_periods_csv(
     if not data:
         raise ValueError("The uploaded file is empty")
 
-    try:
-        text = data.decode("utf-8-sig")
-    except UnicodeDecodeError as exc:
-        raise ValueError("CSV must be UTF-8 encoded") from exc
-
-    buffer = StringIO(text)
+    buffer = TextIOWrapper(BytesIO(data), encoding="utf-8-sig", newline="")
     reader = csv.reader(buffer, delimiter=",")
 
     try:
-        header = next(reader)
-    except StopIteration as exc:
-        raise ValueError("The uploaded file is empty") from exc
+        try:
+            header = next(reader)
+        except StopIteration as exc:
+            raise ValueError("The uploaded file is empty") from exc
 
-    if [item.strip() for item in header] != OPEN_PERIOD_HEADERS:
-        raise ValueError("Invalid header. Please use the provided template")
+        if [item.strip() for item in header] != OPEN_PERIOD_HEADERS:
+            raise ValueError("Invalid header. Please use the provided template")
 
-    return _process_open_period_rows(
-        ((index, row) for index, row in enumerate(reader, start=2)),
-        source_format="csv",
-        max_rows=max_rows,
-    )
+        return _process_open_period_rows(
+            enumerate(reader, start=2),
+            source_format="csv",
+            max_rows=max_rows,
+        )
+    except UnicodeDecodeError as exc:
+        raise ValueError("CSV must be UTF-8 encoded") from exc
 
 
 def parse_structure_open_periods_json(
@@ -1488,6 +1405,7 @@ def parse_structure_open_periods_file(
     raise ValueError("Unsupported file format. Only CSV, XLSX or JSON templates are supported.")
 
 
+@lru_cache(maxsize=1)
 def build_structures_template_workbook() -> bytes:
     workbook = Workbook()
     sheet = workbook.active
@@ -1500,6 +1418,7 @@ def build_structures_template_workbook() -> bytes:
     return output.getvalue()
 
 
+@lru_cache(maxsize=1)
 def build_structures_template_csv() -> str:
     output = StringIO()
     writer = csv.writer(output)
@@ -1525,6 +1444,7 @@ def build_structures_template_json() -> str:
     return json.dumps(serialized, ensure_ascii=False, indent=2)
 
 
+@lru_cache(maxsize=1)
 def build_structure_open_periods_template_workbook() -> bytes:
     workbook = Workbook()
     sheet = workbook.active
@@ -1537,6 +1457,7 @@ def build_structure_open_periods_template_workbook() -> bytes:
     return output.getvalue()
 
 
+@lru_cache(maxsize=1)
 def build_structure_open_periods_template_csv() -> str:
     output = StringIO()
     writer = csv.writer(output)
@@ -1,7 +1,14 @@
-from redis import Redis
+from redis import ConnectionPool, Redis
 from rq import Queue
 
 from app.core.config import REDIS_URL, RQ_QUEUE_NAME
 
-_redis = Redis.from_url(REDIS_URL)
+_pool = ConnectionPool.from_url(
+    REDIS_URL,
+    socket_connect_timeout=5,
+    socket_timeout=5,
+    socket_keepalive=True,
+    health_check_interval=30,
+)
+_redis = Redis(connection_pool=_pool)
 queue = Queue(RQ_QUEUE_NAME, connection=_redis)
@@ -21,6 +21,9 @@ config.set_main_option("sqlalchemy.url", os.environ["DATABASE_URL"])
 
 target_metadata = Base.metadata
 
+# Transaction-scoped settings for the migration run; they revert at COMMIT.
+MIGRATION_SESSION_SETTINGS = "SET LOCAL maintenance_work_mem TO '512MB'"
+
 
 def run_migrations_offline() -> None:
     url = config.get_main_option("sqlalchemy.url")
@@ -57,6 +60,7 @@ def run_migrations_online() -> None:
             )
 
             with context.begin_transaction():
+                connection.execute(text(MIGRATION_SESSION_SETTINGS))
                 context.run_migrations()
     finally:
         lock_conn.execute(text("SELECT pg_advisory_unlock(72726001)"))
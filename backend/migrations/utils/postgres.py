@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 
 import sqlalchemy as sa
 from alembic import op
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.engine import Connection
 from sqlalchemy.sql import text
 
+JSON_TYPE = sa.JSON().with_variant(postgresql.JSONB(astext_type=sa.Text()), "postgresql")
+
 
 def _get_bind() -> Connection:
     bind = op.get_bind()
@@ -17,6 +20,36 @@ def _get_bind() -> Connection:
     return bind
 
 
+def _quote_literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def create_enums_if_not_exist(specs: Mapping[str, Sequence[str]]) -> None:
+    """Create every missing enum type in ``specs`` with one lookup and one statement."""
+
+    bind = _get_bind()
+    existing = set(
+        bind.execute(
+            text(
+                """
+                SELECT typname
+                  FROM pg_type
+                 WHERE typname = ANY(:names)
+                   AND pg_type_is_visible(oid)
+                """
+            ),
+            {"names": list(specs)},
+        ).scalars()
+    )
+    statements = [
+        f'CREATE TYPE "{name}" AS ENUM ({", ".join(map(_quote_literal, values))})'
+        for name, values in specs.items()
+        if name not in existing
+    ]
+    if statements:
+        op.execute(text(";\n".join(statements)))
+
+
 def create_enum_if_not_exists(name: str, values: Sequence[str]) -> sa.Enum:
     """Create an enum type if it does not already exist and return it."""
 
@@ -60,33 +93,35 @@ def drop_enum_if_exists(name: str) -> None:
 def add_enum_value_if_missing(name: str, value: str) -> None:
     """Add a value to an enum type if it is not already present."""
 
-    literal_name = name.replace("'", "''")
-    literal_value = value.replace("'", "''")
-    op.execute(
-        text(
-            f"""
-            DO $$
-            DECLARE
-                enum_name text := '{literal_name}';
-                enum_value text := '{literal_value}';
-            BEGIN
-                IF NOT EXISTS (
-                    SELECT 1
-                      FROM pg_enum e
-                      JOIN pg_type t ON t.oid = e.enumtypid
-                     WHERE t.typname = enum_name
-                       AND e.enumlabel = enum_value
-                ) THEN
-                    EXECUTE format(
-                        'ALTER TYPE %I ADD VALUE IF NOT EXISTS %L',
-                        enum_name,
-                        enum_value
-                    );
-                END IF;
-            END$$;
-            """
-        )
+    add_enum_values_if_missing(name, [value])
+
+
+def add_enum_values_if_missing(name: str, values: Sequence[str]) -> None:
+    """Add every missing value to an enum type with one lookup and one statement."""
+
+    if not values:
+        return
+    bind = _get_bind()
+    existing = set(
+        bind.execute(
+            text(
+                """
+                SELECT e.enumlabel
+                  FROM pg_enum e
+                  JOIN pg_type t ON t.oid = e.enumtypid
+                 WHERE t.typname = :enum_name
+                """
+            ),
+            {"enum_name": name},
+        ).scalars()
     )
+    statements = [
+        f'ALTER TYPE "{name}" ADD VALUE IF NOT EXISTS {_quote_literal(value)}'
+        for value in dict.fromkeys(values)
+        if value not in existing
+    ]
+    if statements:
+        op.execute(text(";\n".join(statements)))
 
 
 def enum_value_exists(name: str, value: str) -> bool:
@@ -108,6 +143,24 @@ def enum_value_exists(name: str, value: str) -> bool:
     return result.scalar() is not None
 
 
+def existing_tables(names: Sequence[str]) -> set[str]:
+    """Return which of ``names`` already exist as tables, using a single query."""
+
+    bind = _get_bind()
+    result = bind.execute(
+        text(
+            """
+            SELECT tablename
+              FROM pg_tables
+             WHERE schemaname = current_schema()
+               AND tablename = ANY(:names)
+            """
+        ),
+        {"names": list(names)},
+    )
+    return set(result.scalars())
+
+
 def add_column_if_not_exists(table: str, column_sql: str) -> None:
     """Add a column to ``table`` using ``column_sql`` if it is missing."""
 
@@ -120,6 +173,12 @@ def create_index_if_not_exists(index_sql: str) -> None:
     op.execute(sa.text(index_sql))
 
 
+def create_indexes_if_not_exist(*index_sql: str) -> None:
+    """Execute several ``CREATE INDEX IF NOT EXISTS`` statements in one round-trip."""
+
+    op.execute(sa.text(";\n".join(index_sql)))
+
+
 def add_constraint_if_not_exists(table: str, constraint_name: str, constraint_sql: str) -> None:
     """Create a constraint if it does not already exist on ``table``."""
 
@@ -128,13 +187,39 @@ def add_constraint_if_not_exists(table: str, constraint_name: str, constraint_sq
         text(
             """
             SELECT 1
-              FROM pg_constraint c
-              JOIN pg_class rel ON rel.oid = c.conrelid
-             WHERE c.conname = :constraint_name
-               AND rel.relname = :table_name
+              FROM pg_constraint
+             WHERE conname = :constraint_name
+               AND conrelid = to_regclass(:table_name)
             """
         ),
         {"constraint_name": constraint_name, "table_name": table},
     ).scalar()
     if not exists:
         op.execute(sa.text(constraint_sql))
+
+
+def add_constraints_if_not_exist(constraints: Sequence[tuple[str, str, str]]) -> None:
+    """Create missing ``(table, constraint_name, constraint_sql)`` entries in one batch."""
+
+    bind = _get_bind()
+    existing = set(
+        bind.execute(
+            text(
+                """
+                SELECT rel.relname, c.conname
+                  FROM pg_constraint c
+                  JOIN pg_class rel ON rel.oid = c.conrelid
+                 WHERE c.conname = ANY(:constraint_names)
+                   AND rel.relnamespace = current_schema()::regnamespace
+                """
+            ),
+            {"constraint_names": [name for _, name, _ in constraints]},
+        ).tuples()
+    )
+    statements = [
+        constraint_sql
+        for table, name, constraint_sql in constraints
+        if (table, name) not in existing
+    ]
+    if statements:
+        op.execute(sa.text(";\n".join(statements)))
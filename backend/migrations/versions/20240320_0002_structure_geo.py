@@ -2,7 +2,6 @@
 
 from collections.abc import Sequence
 
-import sqlalchemy as sa
 from alembic import op
 
 from migrations.utils.postgres import (
@@ -24,8 +23,6 @@ OLD_STRUCTURE_TYPE_VALUES = ("community", "event", "training")
 
 
 def upgrade() -> None:
-    bind = op.get_bind()
-
     if not enum_value_exists("structure_type", "house"):
         op.execute("ALTER TYPE structure_type RENAME TO structure_type_old")
         create_enum_if_not_exists("structure_type", NEW_STRUCTURE_TYPE_VALUES)
@@ -39,12 +36,7 @@ def upgrade() -> None:
     add_column_if_not_exists("structures", "latitude NUMERIC(9, 6)")
     add_column_if_not_exists("structures", "longitude NUMERIC(9, 6)")
 
-    inspector = sa.inspect(bind)
-    unique_constraints = {
-        constraint["name"] for constraint in inspector.get_unique_constraints("structures")
-    }
-    if "structures_slug_key" in unique_constraints:
-        op.drop_constraint("structures_slug_key", "structures", type_="unique")
+    op.execute('ALTER TABLE "structures" DROP CONSTRAINT IF EXISTS structures_slug_key')
 
     create_index_if_not_exists(
         'CREATE UNIQUE INDEX IF NOT EXISTS idx_structures_slug_unique ON "structures" (slug)'
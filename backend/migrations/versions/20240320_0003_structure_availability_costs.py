@@ -7,9 +7,10 @@ from alembic import op
 from sqlalchemy.dialects import postgresql
 
 from migrations.utils.postgres import (
-    create_enum_if_not_exists,
-    create_index_if_not_exists,
+    create_enums_if_not_exist,
+    create_indexes_if_not_exist,
     drop_enum_if_exists,
+    existing_tables,
 )
 
 revision = "20240320_0003"
@@ -21,23 +22,27 @@ depends_on = None
 STRUCTURE_SEASON_VALUES = ("winter", "spring", "summer", "autumn")
 STRUCTURE_COST_MODEL_VALUES = ("per_person_day", "per_person_night", "forfait")
 
+structure_season = postgresql.ENUM(
+    *STRUCTURE_SEASON_VALUES, name="structure_season", create_type=False
+)
+structure_cost_model = postgresql.ENUM(
+    *STRUCTURE_COST_MODEL_VALUES,
+    name="structure_cost_model",
+    create_type=False,
+)
+
 
 def upgrade() -> None:
-    bind = op.get_bind()
-    create_enum_if_not_exists("structure_season", STRUCTURE_SEASON_VALUES)
-    create_enum_if_not_exists("structure_cost_model", STRUCTURE_COST_MODEL_VALUES)
-    structure_season = postgresql.ENUM(
-        *STRUCTURE_SEASON_VALUES, name="structure_season", create_type=False
-    )
-    structure_cost_model = postgresql.ENUM(
-        *STRUCTURE_COST_MODEL_VALUES,
-        name="structure_cost_model",
-        create_type=False,
+    create_enums_if_not_exist(
+        {
+            "structure_season": STRUCTURE_SEASON_VALUES,
+            "structure_cost_model": STRUCTURE_COST_MODEL_VALUES,
+        }
     )
 
-    inspector = sa.inspect(bind)
+    tables = existing_tables(["structure_season_availability", "structure_cost_option"])
 
-    if not inspector.has_table("structure_season_availability"):
+    if "structure_season_availability" not in tables:
         op.create_table(
             "structure_season_availability",
             sa.Column("id", sa.Integer(), primary_key=True, nullable=False),
@@ -53,16 +58,7 @@ def upgrade() -> None:
             sa.Column("capacity_max", sa.Integer(), nullable=True),
         )
 
-    create_index_if_not_exists(
-        "CREATE INDEX IF NOT EXISTS ix_structure_season_availability_structure_id "
-        'ON "structure_season_availability" (structure_id)'
-    )
-    create_index_if_not_exists(
-        "CREATE INDEX IF NOT EXISTS ix_structure_season_availability_season "
-        'ON "structure_season_availability" (season)'
-    )
-
-    if not inspector.has_table("structure_cost_option"):
+    if "structure_cost_option" not in tables:
         op.create_table(
             "structure_cost_option",
             sa.Column("id", sa.Integer(), primary_key=True, nullable=False),
@@ -81,23 +77,26 @@ def upgrade() -> None:
             sa.Column("age_rules", sa.JSON(), nullable=True),
         )
 
-    create_index_if_not_exists(
+    create_indexes_if_not_exist(
+        "CREATE INDEX IF NOT EXISTS ix_structure_season_availability_structure_id "
+        'ON "structure_season_availability" (structure_id)',
+        "CREATE INDEX IF NOT EXISTS ix_structure_season_availability_season "
+        'ON "structure_season_availability" (season)',
         "CREATE INDEX IF NOT EXISTS ix_structure_cost_option_structure_id "
-        'ON "structure_cost_option" (structure_id)'
+        'ON "structure_cost_option" (structure_id)',
     )
 
 
 def downgrade() -> None:
-    bind = op.get_bind()
-    inspector = sa.inspect(bind)
+    tables = existing_tables(["structure_season_availability", "structure_cost_option"])
 
     op.execute("DROP INDEX IF EXISTS ix_structure_cost_option_structure_id")
-    if inspector.has_table("structure_cost_option"):
+    if "structure_cost_option" in tables:
         op.drop_table("structure_cost_option")
 
     op.execute("DROP INDEX IF EXISTS ix_structure_season_availability_season")
     op.execute("DROP INDEX IF EXISTS ix_structure_season_availability_structure_id")
-    if inspector.has_table("structure_season_availability"):
+    if "structure_season_availability" in tables:
         op.drop_table("structure_season_availability")
 
     drop_enum_if_exists("structure_cost_model")
@@ -12,9 +12,11 @@ from alembic import op
 from sqlalchemy.dialects import postgresql
 
 from migrations.utils.postgres import (
-    create_enum_if_not_exists,
+    JSON_TYPE,
+    create_enums_if_not_exist,
     create_index_if_not_exists,
     drop_enum_if_exists,
+    existing_tables,
 )
 
 # revision identifiers, used by Alembic.
@@ -37,33 +39,33 @@ CANDIDATE_STATUS_VALUES = (
 CONTACT_STATUS_VALUES = ("todo", "in_progress", "done", "n_a")
 CONTACT_OUTCOME_VALUES = ("pending", "positive", "negative")
 
-json_type = sa.JSON().with_variant(postgresql.JSONB(astext_type=sa.Text()), "postgresql")
+branch_enum = postgresql.ENUM(*BRANCH_VALUES, name="event_branch", create_type=False)
+status_enum = postgresql.ENUM(*STATUS_VALUES, name="event_status", create_type=False)
+candidate_status_enum = postgresql.ENUM(
+    *CANDIDATE_STATUS_VALUES, name="event_candidate_status", create_type=False
+)
+contact_status_enum = postgresql.ENUM(
+    *CONTACT_STATUS_VALUES, name="event_contact_task_status", create_type=False
+)
+contact_outcome_enum = postgresql.ENUM(
+    *CONTACT_OUTCOME_VALUES, name="event_contact_task_outcome", create_type=False
+)
 
 
 def upgrade() -> None:
-    bind = op.get_bind()
-
-    create_enum_if_not_exists("event_branch", BRANCH_VALUES)
-    create_enum_if_not_exists("event_status", STATUS_VALUES)
-    create_enum_if_not_exists("event_candidate_status", CANDIDATE_STATUS_VALUES)
-    create_enum_if_not_exists("event_contact_task_status", CONTACT_STATUS_VALUES)
-    create_enum_if_not_exists("event_contact_task_outcome", CONTACT_OUTCOME_VALUES)
-
-    branch_enum = postgresql.ENUM(*BRANCH_VALUES, name="event_branch", create_type=False)
-    status_enum = postgresql.ENUM(*STATUS_VALUES, name="event_status", create_type=False)
-    candidate_status_enum = postgresql.ENUM(
-        *CANDIDATE_STATUS_VALUES, name="event_candidate_status", create_type=False
-    )
-    contact_status_enum = postgresql.ENUM(
-        *CONTACT_STATUS_VALUES, name="event_contact_task_status", create_type=False
-    )
-    contact_outcome_enum = postgresql.ENUM(
-        *CONTACT_OUTCOME_VALUES, name="event_contact_task_outcome", create_type=False
+    create_enums_if_not_exist(
+        {
+            "event_branch": BRANCH_VALUES,
+            "event_status": STATUS_VALUES,
+            "event_candidate_status": CANDIDATE_STATUS_VALUES,
+            "event_contact_task_status": CONTACT_STATUS_VALUES,
+            "event_contact_task_outcome": CONTACT_OUTCOME_VALUES,
+        }
     )
 
-    inspector = sa.inspect(bind)
+    tables = existing_tables(["events", "event_structure_candidate", "event_contact_task"])
 
-    if not inspector.has_table("events"):
+    if "events" not in tables:
         op.create_table(
             "events",
             sa.Column("id", sa.Integer(), primary_key=True),
@@ -74,10 +76,10 @@ def upgrade() -> None:
             sa.Column("end_date", sa.Date(), nullable=False),
             sa.Column(
                 "participants",
-                json_type,
+                JSON_TYPE,
                 nullable=False,
                 server_default=sa.text(
-                    "jsonb_build_object('lc', 0, 'eg', 0, 'rs', 0, 'leaders', 0)"
+                    """'{"lc": 0, "eg": 0, "rs": 0, "leaders": 0}'::jsonb"""
                 ),
             ),
             sa.Column("budget_total", sa.Numeric(10, 2), nullable=True),
@@ -98,7 +100,7 @@ def upgrade() -> None:
             ),
         )
 
-    if not inspector.has_table("event_structure_candidate"):
+    if "event_structure_candidate" not in tables:
         op.create_table(
             "event_structure_candidate",
             sa.Column("id", sa.Integer(), primary_key=True),
@@ -131,7 +133,7 @@ def upgrade() -> None:
         'ON "event_structure_candidate" (event_id, status)'
     )
 
-    if not inspector.has_table("event_contact_task"):
+    if "event_contact_task" not in tables:
         op.create_table(
             "event_contact_task",
             sa.Column("id", sa.Integer(), primary_key=True),
@@ -167,15 +169,14 @@ def upgrade() -> None:
 
 
 def downgrade() -> None:
-    bind = op.get_bind()
-    inspector = sa.inspect(bind)
+    tables = existing_tables(["events", "event_structure_candidate", "event_contact_task"])
 
-    if inspector.has_table("event_contact_task"):
+    if "event_contact_task" in tables:
         op.drop_table("event_contact_task")
     op.execute("DROP INDEX IF EXISTS ix_event_structure_candidate_event_status")
-    if inspector.has_table("event_structure_candidate"):
+    if "event_structure_candidate" in tables:
         op.drop_table("event_structure_candidate")
-    if inspector.has_table("events"):
+    if "events" in tables:
         op.drop_table("events")
 
     drop_enum_if_exists("event_contact_task_outcome")
@@ -7,9 +7,11 @@ from alembic import op
 from sqlalchemy.dialects import postgresql
 
 from migrations.utils.postgres import (
-    create_enum_if_not_exists,
-    create_index_if_not_exists,
+    JSON_TYPE,
+    create_enums_if_not_exist,
+    create_indexes_if_not_exist,
     drop_enum_if_exists,
+    existing_tables,
 )
 
 # revision identifiers, used by Alembic.
@@ -20,21 +22,19 @@ depends_on = None
 
 scenario_enum_name = "quote_scenario"
 scenario_enum_values = ("best", "realistic", "worst")
-json_type = sa.JSON().with_variant(postgresql.JSONB(astext_type=sa.Text()), "postgresql")
+scenario_enum = postgresql.ENUM(
+    *scenario_enum_values,
+    name=scenario_enum_name,
+    create_type=False,
+)
 
 
 def upgrade() -> None:
-    create_enum_if_not_exists(scenario_enum_name, scenario_enum_values)
-    scenario_enum = postgresql.ENUM(
-        *scenario_enum_values,
-        name=scenario_enum_name,
-        create_type=False,
-    )
+    create_enums_if_not_exist({scenario_enum_name: scenario_enum_values})
 
-    bind = op.get_bind()
-    inspector = sa.inspect(bind)
+    tables = existing_tables(["quotes"])
 
-    if not inspector.has_table("quotes"):
+    if "quotes" not in tables:
         op.create_table(
             "quotes",
             sa.Column("id", sa.Integer(), primary_key=True),
@@ -52,9 +52,9 @@ def upgrade() -> None:
             ),
             sa.Column("scenario", scenario_enum, nullable=False, server_default="realistic"),
             sa.Column("currency", sa.CHAR(length=3), nullable=False, server_default="EUR"),
-            sa.Column("totals", json_type, nullable=False),
-            sa.Column("breakdown", json_type, nullable=False),
-            sa.Column("inputs", json_type, nullable=False),
+            sa.Column("totals", JSON_TYPE, nullable=False),
+            sa.Column("breakdown", JSON_TYPE, nullable=False),
+            sa.Column("inputs", JSON_TYPE, nullable=False),
             sa.Column(
                 "created_at",
                 sa.DateTime(timezone=True),
@@ -63,19 +63,16 @@ def upgrade() -> None:
             ),
         )
 
-    create_index_if_not_exists(
-        'CREATE INDEX IF NOT EXISTS ix_quotes_event_id ON "quotes" (event_id)'
-    )
-    create_index_if_not_exists(
-        'CREATE INDEX IF NOT EXISTS ix_quotes_structure_id ON "quotes" (structure_id)'
+    create_indexes_if_not_exist(
+        'CREATE INDEX IF NOT EXISTS ix_quotes_event_id ON "quotes" (event_id)',
+        'CREATE INDEX IF NOT EXISTS ix_quotes_structure_id ON "quotes" (structure_id)',
     )
 
 
 def downgrade() -> None:
     op.execute("DROP INDEX IF EXISTS ix_quotes_structure_id")
     op.execute("DROP INDEX IF EXISTS ix_quotes_event_id")
-    bind = op.get_bind()
-    inspector = sa.inspect(bind)
-    if inspector.has_table("quotes"):
+    tables = existing_tables(["quotes"])
+    if "quotes" in tables:
         op.drop_table("quotes")
     drop_enum_if_exists(scenario_enum_name)
@@ -8,10 +8,11 @@ from sqlalchemy.dialects import postgresql
 
 from migrations.utils.postgres import (
     add_column_if_not_exists,
-    add_constraint_if_not_exists,
-    create_enum_if_not_exists,
+    add_constraints_if_not_exist,
+    create_enums_if_not_exist,
     create_index_if_not_exists,
     drop_enum_if_exists,
+    existing_tables,
 )
 
 # revision identifiers, used by Alembic.
@@ -20,12 +21,17 @@ down_revision: str | None = "20240320_0005"
 branch_labels: Sequence[str] | None = None
 depends_on: Sequence[str] | None = None
 
+EVENT_MEMBER_ROLE_VALUES = ("owner", "collab", "viewer")
+
+event_member_role = postgresql.ENUM(
+    *EVENT_MEMBER_ROLE_VALUES, name="event_member_role", create_type=False
+)
+
 
 def upgrade() -> None:
-    bind = op.get_bind()
-    inspector = sa.inspect(bind)
+    tables = existing_tables(["users", "refresh_tokens", "event_members"])
 
-    if not inspector.has_table("users"):
+    if "users" not in tables:
         op.create_table(
             "users",
             sa.Column("id", sa.String(length=36), primary_key=True),
@@ -42,7 +48,7 @@ def upgrade() -> None:
             ),
         )
 
-    if not inspector.has_table("refresh_tokens"):
+    if "refresh_tokens" not in tables:
         op.create_table(
             "refresh_tokens",
             sa.Column("id", sa.String(length=36), primary_key=True),
@@ -64,12 +70,9 @@ def upgrade() -> None:
         'ON "refresh_tokens" (user_id, revoked)'
     )
 
-    create_enum_if_not_exists("event_member_role", ("owner", "collab", "viewer"))
-    event_member_role = postgresql.ENUM(
-        "owner", "collab", "viewer", name="event_member_role", create_type=False
-    )
+    create_enums_if_not_exist({"event_member_role": EVENT_MEMBER_ROLE_VALUES})
 
-    if not inspector.has_table("event_members"):
+    if "event_members" not in tables:
         op.create_table(
             "event_members",
             sa.Column("id", sa.Integer(), primary_key=True),
@@ -86,27 +89,29 @@ def upgrade() -> None:
     )
 
     add_column_if_not_exists("event_structure_candidate", "assigned_user_id VARCHAR(36)")
-    add_constraint_if_not_exists(
-        "event_structure_candidate",
-        "event_structure_candidate_assigned_user_id_fkey",
-        'ALTER TABLE "event_structure_candidate" ADD CONSTRAINT '
-        "event_structure_candidate_assigned_user_id_fkey "
-        'FOREIGN KEY (assigned_user_id) REFERENCES "users" (id) ON DELETE SET NULL',
-    )
-
     add_column_if_not_exists("event_contact_task", "assigned_user_id VARCHAR(36)")
-    add_constraint_if_not_exists(
-        "event_contact_task",
-        "event_contact_task_assigned_user_id_fkey",
-        'ALTER TABLE "event_contact_task" ADD CONSTRAINT '
-        "event_contact_task_assigned_user_id_fkey "
-        'FOREIGN KEY (assigned_user_id) REFERENCES "users" (id) ON DELETE SET NULL',
+    add_constraints_if_not_exist(
+        [
+            (
+                "event_structure_candidate",
+                "event_structure_candidate_assigned_user_id_fkey",
+                'ALTER TABLE "event_structure_candidate" ADD CONSTRAINT '
+                "event_structure_candidate_assigned_user_id_fkey "
+                'FOREIGN KEY (assigned_user_id) REFERENCES "users" (id) ON DELETE SET NULL',
+            ),
+            (
+                "event_contact_task",
+                "event_contact_task_assigned_user_id_fkey",
+                'ALTER TABLE "event_contact_task" ADD CONSTRAINT '
+                "event_contact_task_assigned_user_id_fkey "
+                'FOREIGN KEY (assigned_user_id) REFERENCES "users" (id) ON DELETE SET NULL',
+            ),
+        ]
     )
 
 
 def downgrade() -> None:
-    bind = op.get_bind()
-    inspector = sa.inspect(bind)
+    tables = existing_tables(["users", "refresh_tokens", "event_members"])
 
     op.execute(
         'ALTER TABLE "event_contact_task" '
@@ -121,14 +126,14 @@ def downgrade() -> None:
     op.execute('ALTER TABLE "event_structure_candidate" DROP COLUMN IF EXISTS assigned_user_id')
 
     op.execute("DROP INDEX IF EXISTS ix_event_members_event_id")
-    if inspector.has_table("event_members"):
+    if "event_members" in tables:
         op.drop_table("event_members")
 
     op.execute("DROP INDEX IF EXISTS ix_refresh_tokens_user_id_revoked")
-    if inspector.has_table("refresh_tokens"):
+    if "refresh_tokens" in tables:
         op.drop_table("refresh_tokens")
 
-    if inspector.has_table("users"):
+    if "users" in tables:
         op.drop_table("users")
 
     drop_enum_if_exists("event_member_role")
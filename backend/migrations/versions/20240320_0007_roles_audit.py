@@ -10,6 +10,7 @@ from alembic import op
 from migrations.utils.postgres import (
     add_column_if_not_exists,
     create_index_if_not_exists,
+    existing_tables,
 )
 
 # revision identifiers, used by Alembic.
@@ -20,10 +21,9 @@ depends_on: Sequence[str] | None = None
 
 
 def upgrade() -> None:
-    bind = op.get_bind()
-    inspector = sa.inspect(bind)
+    tables = existing_tables(["audit_log", "password_reset_tokens"])
 
-    if not inspector.has_table("audit_log"):
+    if "audit_log" not in tables:
         op.create_table(
             "audit_log",
             sa.Column("id", sa.Integer(), primary_key=True),
@@ -43,7 +43,7 @@ def upgrade() -> None:
             sa.ForeignKeyConstraint(["actor_user_id"], ["users.id"], ondelete="SET NULL"),
         )
 
-    if not inspector.has_table("password_reset_tokens"):
+    if "password_reset_tokens" not in tables:
         op.create_table(
             "password_reset_tokens",
             sa.Column("id", sa.String(length=36), primary_key=True),
@@ -74,11 +74,10 @@ def upgrade() -> None:
 
 
 def downgrade() -> None:
-    bind = op.get_bind()
-    inspector = sa.inspect(bind)
+    tables = existing_tables(["audit_log", "password_reset_tokens"])
 
     op.execute("DROP INDEX IF EXISTS ix_password_reset_tokens_user_id_used")
-    if inspector.has_table("password_reset_tokens"):
+    if "password_reset_tokens" in tables:
         op.drop_table("password_reset_tokens")
-    if inspector.has_table("audit_log"):
+    if "audit_log" in tables:
         op.drop_table("audit_log")
@@ -6,6 +6,8 @@ from collections.abc import Sequence
 
 from alembic import op
 
+from migrations.utils.postgres import create_indexes_if_not_exist
+
 revision: str = "20240320_0008"
 down_revision: str | None = "20240320_0007"
 branch_labels: Sequence[str] | None = None
@@ -13,41 +15,22 @@ depends_on: Sequence[str] | None = None
 
 
 def upgrade() -> None:
-    op.execute(
-        """
-        CREATE INDEX IF NOT EXISTS ix_structures_lower_name
-        ON structures (lower(name))
-        """.strip()
-    )
-    op.execute(
-        """
-        CREATE INDEX IF NOT EXISTS ix_structures_province
-        ON structures (province)
-        """.strip()
-    )
-    op.execute(
-        """
-        CREATE INDEX IF NOT EXISTS ix_structures_type
-        ON structures (type)
-        """.strip()
-    )
-    op.execute(
-        """
-        CREATE INDEX IF NOT EXISTS ix_structure_season_availability_structure_id_season
-        ON structure_season_availability (structure_id, season)
-        """.strip()
-    )
-    op.execute(
-        """
-        CREATE INDEX IF NOT EXISTS ix_structure_cost_option_structure_id_model
-        ON structure_cost_option (structure_id, model)
-        """.strip()
+    create_indexes_if_not_exist(
+        "CREATE INDEX IF NOT EXISTS ix_structures_lower_name ON structures (lower(name))",
+        "CREATE INDEX IF NOT EXISTS ix_structures_province ON structures (province)",
+        "CREATE INDEX IF NOT EXISTS ix_structures_type ON structures (type)",
+        "CREATE INDEX IF NOT EXISTS ix_structure_season_availability_structure_id_season "
+        "ON structure_season_availability (structure_id, season)",
+        "CREATE INDEX IF NOT EXISTS ix_structure_cost_option_structure_id_model "
+        "ON structure_cost_option (structure_id, model)",
     )
 
 
 def downgrade() -> None:
-    op.execute("DROP INDEX IF EXISTS ix_structure_cost_option_structure_id_model")
-    op.execute("DROP INDEX IF EXISTS ix_structure_season_availability_structure_id_season")
-    op.execute("DROP INDEX IF EXISTS ix_structures_type")
-    op.execute("DROP INDEX IF EXISTS ix_structures_province")
-    op.execute("DROP INDEX IF EXISTS ix_structures_lower_name")
+    op.execute(
+        "DROP INDEX IF EXISTS ix_structure_cost_option_structure_id_model;\n"
+        "DROP INDEX IF EXISTS ix_structure_season_availability_structure_id_season;\n"
+        "DROP INDEX IF EXISTS ix_structures_type;\n"
+        "DROP INDEX IF EXISTS ix_structures_province;\n"
+        "DROP INDEX IF EXISTS ix_structures_lower_name"
+    )
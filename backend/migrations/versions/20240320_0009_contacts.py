@@ -2,6 +2,12 @@ import sqlalchemy as sa
 from alembic import op
 from sqlalchemy.dialects import postgresql
 
+from migrations.utils.postgres import (
+    add_constraints_if_not_exist,
+    create_indexes_if_not_exist,
+    existing_tables,
+)
+
 revision = "20240320_0009_contacts"
 down_revision = "20240320_0008"
 branch_labels = None
@@ -11,8 +17,7 @@ CHANNEL_VALUES = ("email", "phone", "other")
 
 
 def upgrade():
-    bind = op.get_bind()
-    insp = sa.inspect(bind)
+    tables = existing_tables(["contacts", "event_structure_candidate"])
 
     op.execute("""
     DO $$
@@ -29,7 +34,7 @@ def upgrade():
         validate_strings=True,
     )
 
-    if not insp.has_table("contacts"):
+    if "contacts" not in tables:
         op.create_table(
             "contacts",
             sa.Column("id", sa.Integer, primary_key=True),
@@ -66,96 +71,45 @@ def upgrade():
             ),
         )
 
-    insp = sa.inspect(bind)
-
-    if insp.has_table("contacts"):
-        existing_indexes = {idx["name"] for idx in insp.get_indexes("contacts")}
-        if "idx_contacts_structure" not in existing_indexes:
-            op.create_index("idx_contacts_structure", "contacts", ["structure_id"])
-        if "idx_contacts_email" not in existing_indexes:
-            op.create_index(
-                "idx_contacts_email",
-                "contacts",
-                ["email"],
-                unique=False,
-                postgresql_where=sa.text("email IS NOT NULL"),
-                sqlite_where=sa.text("email IS NOT NULL"),
-            )
-        if "uix_contacts_primary_per_structure" not in existing_indexes:
-            op.create_index(
-                "uix_contacts_primary_per_structure",
+    create_indexes_if_not_exist(
+        'CREATE INDEX IF NOT EXISTS idx_contacts_structure ON "contacts" (structure_id)',
+        'CREATE INDEX IF NOT EXISTS idx_contacts_email ON "contacts" (email) '
+        "WHERE email IS NOT NULL",
+        "CREATE UNIQUE INDEX IF NOT EXISTS uix_contacts_primary_per_structure "
+        'ON "contacts" (structure_id) WHERE is_primary',
+    )
+    add_constraints_if_not_exist(
+        [
+            (
                 "contacts",
-                ["structure_id"],
-                unique=True,
-                postgresql_where=sa.text("is_primary"),
-                sqlite_where=sa.text("is_primary = 1"),
-            )
-
-        existing_constraints = {
-            constraint["name"] for constraint in insp.get_unique_constraints("contacts")
-        }
-        if "uq_contact_structure_email" not in existing_constraints:
-            op.create_unique_constraint(
-                "uq_contact_structure_email", "contacts", ["structure_id", "email"]
-            )
+                "uq_contact_structure_email",
+                'ALTER TABLE "contacts" ADD CONSTRAINT uq_contact_structure_email '
+                "UNIQUE (structure_id, email)",
+            ),
+        ]
+    )
 
-    if insp.has_table("event_structure_candidate"):
-        candidate_columns = {
-            column["name"] for column in insp.get_columns("event_structure_candidate")
-        }
-        if "contact_id" not in candidate_columns:
-            op.add_column(
-                "event_structure_candidate",
-                sa.Column(
-                    "contact_id",
-                    sa.Integer,
-                    sa.ForeignKey("contacts.id", ondelete="SET NULL"),
-                    nullable=True,
-                ),
-            )
-            op.create_index(
-                "ix_event_structure_candidate_contact_id",
-                "event_structure_candidate",
-                ["contact_id"],
-            )
+    if "event_structure_candidate" in tables:
+        op.execute(
+            'ALTER TABLE "event_structure_candidate" '
+            "ADD COLUMN IF NOT EXISTS contact_id INTEGER "
+            "CONSTRAINT fk_event_structure_candidate_contact_id_contacts "
+            'REFERENCES "contacts" (id) ON DELETE SET NULL;\n'
+            "CREATE INDEX IF NOT EXISTS ix_event_structure_candidate_contact_id "
+            'ON "event_structure_candidate" (contact_id)'
+        )
 
 
 def downgrade():
-    bind = op.get_bind()
-    insp = sa.inspect(bind)
-
-    if insp.has_table("event_structure_candidate"):
-        candidate_columns = {
-            column["name"] for column in insp.get_columns("event_structure_candidate")
-        }
-        if "contact_id" in candidate_columns:
-            existing_indexes = {
-                idx["name"] for idx in insp.get_indexes("event_structure_candidate")
-            }
-            if "ix_event_structure_candidate_contact_id" in existing_indexes:
-                op.drop_index(
-                    "ix_event_structure_candidate_contact_id",
-                    table_name="event_structure_candidate",
-                )
-            op.drop_column("event_structure_candidate", "contact_id")
+    tables = existing_tables(["contacts", "event_structure_candidate"])
 
-    insp = sa.inspect(bind)
-
-    if insp.has_table("contacts"):
-        existing_indexes = {idx["name"] for idx in insp.get_indexes("contacts")}
-        if "uix_contacts_primary_per_structure" in existing_indexes:
-            op.drop_index("uix_contacts_primary_per_structure", table_name="contacts")
-        if "idx_contacts_email" in existing_indexes:
-            op.drop_index("idx_contacts_email", table_name="contacts")
-        if "idx_contacts_structure" in existing_indexes:
-            op.drop_index("idx_contacts_structure", table_name="contacts")
-
-        existing_constraints = {
-            constraint["name"] for constraint in insp.get_unique_constraints("contacts")
-        }
-        if "uq_contact_structure_email" in existing_constraints:
-            op.drop_constraint("uq_contact_structure_email", "contacts", type_="unique")
+    if "event_structure_candidate" in tables:
+        op.execute(
+            "DROP INDEX IF EXISTS ix_event_structure_candidate_contact_id;\n"
+            'ALTER TABLE "event_structure_candidate" DROP COLUMN IF EXISTS contact_id'
+        )
 
+    if "contacts" in tables:
         op.drop_table("contacts")
 
     op.execute("DROP TYPE IF EXISTS contact_preferred_channel")
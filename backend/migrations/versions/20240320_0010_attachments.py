@@ -9,9 +9,10 @@ from alembic import op
 from sqlalchemy.dialects import postgresql
 
 from migrations.utils.postgres import (
-    create_enum_if_not_exists,
+    create_enums_if_not_exist,
     create_index_if_not_exists,
     drop_enum_if_exists,
+    existing_tables,
 )
 
 revision: str = "20240320_0010_attachments"
@@ -22,19 +23,17 @@ depends_on: Sequence[str] | None = None
 
 OWNER_TYPE_VALUES = ("structure", "event")
 
+owner_type_enum = postgresql.ENUM(
+    *OWNER_TYPE_VALUES,
+    name="attachment_owner_type",
+    create_type=False,
+)
 
-def upgrade() -> None:
-    bind = op.get_bind()
-    inspector = sa.inspect(bind)
 
-    create_enum_if_not_exists("attachment_owner_type", OWNER_TYPE_VALUES)
-    owner_type_enum = postgresql.ENUM(
-        *OWNER_TYPE_VALUES,
-        name="attachment_owner_type",
-        create_type=False,
-    )
+def upgrade() -> None:
+    create_enums_if_not_exist({"attachment_owner_type": OWNER_TYPE_VALUES})
 
-    if not inspector.has_table("attachments"):
+    if "attachments" not in existing_tables(["attachments"]):
         op.create_table(
             "attachments",
             sa.Column("id", sa.Integer(), primary_key=True),
@@ -65,10 +64,7 @@ def upgrade() -> None:
 
 
 def downgrade() -> None:
-    bind = op.get_bind()
-    inspector = sa.inspect(bind)
-
     op.execute("DROP INDEX IF EXISTS ix_attachments_owner")
-    if inspector.has_table("attachments"):
+    if "attachments" in existing_tables(["attachments"]):
         op.drop_table("attachments")
     drop_enum_if_exists("attachment_owner_type")
@@ -1,6 +1,5 @@
 """Add extra structure details"""
 
-import sqlalchemy as sa
 from alembic import op
 
 # revision identifiers, used by Alembic.
@@ -11,28 +10,26 @@ depends_on = None
 
 
 def upgrade() -> None:
-    op.add_column("structures", sa.Column("beds", sa.Integer(), nullable=True))
-    op.add_column("structures", sa.Column("bathrooms", sa.Integer(), nullable=True))
-    op.add_column("structures", sa.Column("showers", sa.Integer(), nullable=True))
-    op.add_column("structures", sa.Column("dining_capacity", sa.Integer(), nullable=True))
-    op.add_column(
-        "structures",
-        sa.Column(
-            "has_kitchen",
-            sa.Boolean(),
-            nullable=False,
-            server_default=sa.false(),
-        ),
+    op.execute(
+        'ALTER TABLE "structures" '
+        "ADD COLUMN beds INTEGER, "
+        "ADD COLUMN bathrooms INTEGER, "
+        "ADD COLUMN showers INTEGER, "
+        "ADD COLUMN dining_capacity INTEGER, "
+        "ADD COLUMN has_kitchen BOOLEAN NOT NULL DEFAULT false, "
+        "ADD COLUMN website_url VARCHAR(255), "
+        "ADD COLUMN notes TEXT"
     )
-    op.add_column("structures", sa.Column("website_url", sa.String(length=255), nullable=True))
-    op.add_column("structures", sa.Column("notes", sa.Text(), nullable=True))
 
 
 def downgrade() -> None:
-    op.drop_column("structures", "notes")
-    op.drop_column("structures", "website_url")
-    op.drop_column("structures", "has_kitchen")
-    op.drop_column("structures", "dining_capacity")
-    op.drop_column("structures", "showers")
-    op.drop_column("structures", "bathrooms")
-    op.drop_column("structures", "beds")
+    op.execute(
+        'ALTER TABLE "structures" '
+        "DROP COLUMN notes, "
+        "DROP COLUMN website_url, "
+        "DROP COLUMN has_kitchen, "
+        "DROP COLUMN dining_capacity, "
+        "DROP COLUMN showers, "
+        "DROP COLUMN bathrooms, "
+        "DROP COLUMN beds"
+    )
@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import sqlalchemy as sa
 from alembic import op
-from sqlalchemy.engine import reflection
+
+from migrations.utils.postgres import existing_tables
 
 revision: str = "20240701_0012_structure_photos"
 down_revision: str | None = "20240701_0012"
@@ -13,9 +14,7 @@ depends_on: tuple[str, ...] | None = None
 
 
 def upgrade() -> None:
-    bind = op.get_bind()
-    inspector = reflection.Inspector.from_engine(bind)
-    if not inspector.has_table("structure_photos"):
+    if "structure_photos" not in existing_tables(["structure_photos"]):
         op.create_table(
             "structure_photos",
             sa.Column("id", sa.Integer(), primary_key=True),
@@ -53,9 +52,7 @@ def upgrade() -> None:
 
 
 def downgrade() -> None:
-    bind = op.get_bind()
-    inspector = reflection.Inspector.from_engine(bind)
-    if inspector.has_table("structure_photos"):
+    if "structure_photos" in existing_tables(["structure_photos"]):
         op.drop_index("ix_structure_photos_position", table_name="structure_photos")
         op.drop_index("ix_structure_photos_structure_id", table_name="structure_photos")
         op.drop_table("structure_photos")
@@ -4,256 +4,118 @@ from __future__ import annotations
 
 from collections.abc import Sequence
 
-import sqlalchemy as sa
 from alembic import op
 
+from migrations.utils.postgres import create_enums_if_not_exist, drop_enum_if_exists
+
 revision: str = "20240701_0012"
 down_revision: str | None = "20240611_0011"
 branch_labels: Sequence[str] | None = None
 depends_on: Sequence[str] | None = None
 
+FIRE_POLICY_VALUES = ("allowed", "with_permit", "forbidden")
+WATER_SOURCE_VALUES = ("none", "fountain", "tap", "river")
+
 
 def upgrade() -> None:
     op.alter_column("structures", "beds", new_column_name="indoor_beds")
     op.alter_column("structures", "bathrooms", new_column_name="indoor_bathrooms")
     op.alter_column("structures", "showers", new_column_name="indoor_showers")
 
-    fire_policy_enum = sa.Enum(
-        "allowed",
-        "with_permit",
-        "forbidden",
-        name="fire_policy",
-    )
-    water_source_enum = sa.Enum(
-        "none",
-        "fountain",
-        "tap",
-        "river",
-        name="water_source",
+    create_enums_if_not_exist(
+        {
+            "fire_policy": FIRE_POLICY_VALUES,
+            "water_source": WATER_SOURCE_VALUES,
+        }
+    )
+
+    op.execute(
+        'ALTER TABLE "structures" '
+        "ADD COLUMN hot_water BOOLEAN NOT NULL DEFAULT false, "
+        "ADD COLUMN land_area_m2 NUMERIC(10, 2), "
+        "ADD COLUMN max_tents INTEGER, "
+        "ADD COLUMN shelter_on_field BOOLEAN NOT NULL DEFAULT false, "
+        "ADD COLUMN toilets_on_field INTEGER, "
+        "ADD COLUMN water_source water_source, "
+        "ADD COLUMN electricity_available BOOLEAN NOT NULL DEFAULT false, "
+        "ADD COLUMN fire_policy fire_policy, "
+        "ADD COLUMN access_by_car BOOLEAN NOT NULL DEFAULT false, "
+        "ADD COLUMN access_by_coach BOOLEAN NOT NULL DEFAULT false, "
+        "ADD COLUMN access_by_public_transport BOOLEAN NOT NULL DEFAULT false, "
+        "ADD COLUMN coach_turning_area BOOLEAN NOT NULL DEFAULT false, "
+        "ADD COLUMN max_vehicle_height_m NUMERIC(4, 2), "
+        "ADD COLUMN nearest_bus_stop VARCHAR(255), "
+        "ADD COLUMN winter_open BOOLEAN NOT NULL DEFAULT false, "
+        "ADD COLUMN weekend_only BOOLEAN NOT NULL DEFAULT false, "
+        "ADD COLUMN has_field_poles BOOLEAN NOT NULL DEFAULT false, "
+        "ADD COLUMN notes_logistics TEXT"
+    )
+
+    op.execute(
+        "DROP INDEX IF EXISTS ix_structures_province;\n"
+        "DROP INDEX IF EXISTS ix_structures_type;\n"
+        'CREATE INDEX ix_structures_province ON "structures" (province) '
+        "WHERE province IS NOT NULL;\n"
+        'CREATE INDEX ix_structures_type ON "structures" (type) WHERE type IS NOT NULL;\n'
+        'CREATE INDEX ix_structures_fire_policy ON "structures" (fire_policy) '
+        "WHERE fire_policy IS NOT NULL;\n"
+        'CREATE INDEX ix_structures_access_by_coach ON "structures" (access_by_coach) '
+        "WHERE access_by_coach IS TRUE;\n"
+        "CREATE INDEX ix_structures_access_by_public_transport "
+        'ON "structures" (access_by_public_transport) '
+        "WHERE access_by_public_transport IS TRUE"
+    )
+
+    op.execute(
+        'ALTER TABLE "structures" '
+        "ALTER COLUMN hot_water DROP DEFAULT, "
+        "ALTER COLUMN shelter_on_field DROP DEFAULT, "
+        "ALTER COLUMN electricity_available DROP DEFAULT, "
+        "ALTER COLUMN access_by_car DROP DEFAULT, "
+        "ALTER COLUMN access_by_coach DROP DEFAULT, "
+        "ALTER COLUMN access_by_public_transport DROP DEFAULT, "
+        "ALTER COLUMN coach_turning_area DROP DEFAULT, "
+        "ALTER COLUMN winter_open DROP DEFAULT, "
+        "ALTER COLUMN weekend_only DROP DEFAULT, "
+        "ALTER COLUMN has_field_poles DROP DEFAULT"
     )
 
-    bind = op.get_bind()
-    fire_policy_enum.create(bind, checkfirst=True)
-    water_source_enum.create(bind, checkfirst=True)
-
-    op.add_column(
-        "structures",
-        sa.Column("hot_water", sa.Boolean(), nullable=False, server_default=sa.text("false")),
-    )
-    op.add_column(
-        "structures",
-        sa.Column("land_area_m2", sa.Numeric(10, 2), nullable=True),
-    )
-    op.add_column(
-        "structures",
-        sa.Column("max_tents", sa.Integer(), nullable=True),
-    )
-    op.add_column(
-        "structures",
-        sa.Column(
-            "shelter_on_field",
-            sa.Boolean(),
-            nullable=False,
-            server_default=sa.text("false"),
-        ),
-    )
-    op.add_column(
-        "structures",
-        sa.Column("toilets_on_field", sa.Integer(), nullable=True),
-    )
-    op.add_column(
-        "structures",
-        sa.Column("water_source", water_source_enum, nullable=True),
-    )
-    op.add_column(
-        "structures",
-        sa.Column(
-            "electricity_available",
-            sa.Boolean(),
-            nullable=False,
-            server_default=sa.text("false"),
-        ),
-    )
-    op.add_column(
-        "structures",
-        sa.Column("fire_policy", fire_policy_enum, nullable=True),
-    )
-    op.add_column(
-        "structures",
-        sa.Column(
-            "access_by_car",
-            sa.Boolean(),
-            nullable=False,
-            server_default=sa.text("false"),
-        ),
-    )
-    op.add_column(
-        "structures",
-        sa.Column(
-            "access_by_coach",
-            sa.Boolean(),
-            nullable=False,
-            server_default=sa.text("false"),
-        ),
-    )
-    op.add_column(
-        "structures",
-        sa.Column(
-            "access_by_public_transport",
-            sa.Boolean(),
-            nullable=False,
-            server_default=sa.text("false"),
-        ),
-    )
-    op.add_column(
-        "structures",
-        sa.Column(
-            "coach_turning_area",
-            sa.Boolean(),
-            nullable=False,
-            server_default=sa.text("false"),
-        ),
-    )
-    op.add_column(
-        "structures",
-        sa.Column("max_vehicle_height_m", sa.Numeric(4, 2), nullable=True),
-    )
-    op.add_column(
-        "structures",
-        sa.Column("nearest_bus_stop", sa.String(length=255), nullable=True),
-    )
-    op.add_column(
-        "structures",
-        sa.Column(
-            "winter_open",
-            sa.Boolean(),
-            nullable=False,
-            server_default=sa.text("false"),
-        ),
-    )
-    op.add_column(
-        "structures",
-        sa.Column(
-            "weekend_only",
-            sa.Boolean(),
-            nullable=False,
-            server_default=sa.text("false"),
-        ),
-    )
-    op.add_column(
-        "structures",
-        sa.Column(
-            "has_field_poles",
-            sa.Boolean(),
-            nullable=False,
-            server_default=sa.text("false"),
-        ),
-    )
-    op.add_column(
-        "structures",
-        sa.Column("notes_logistics", sa.Text(), nullable=True),
-    )
-
-    op.execute("DROP INDEX IF EXISTS ix_structures_province")
-    op.execute("DROP INDEX IF EXISTS ix_structures_type")
-
-    op.create_index(
-        "ix_structures_province",
-        "structures",
-        ["province"],
-        postgresql_where=sa.text("province IS NOT NULL"),
-    )
-    op.create_index(
-        "ix_structures_type",
-        "structures",
-        ["type"],
-        postgresql_where=sa.text("type IS NOT NULL"),
-    )
-    op.create_index(
-        "ix_structures_fire_policy",
-        "structures",
-        ["fire_policy"],
-        postgresql_where=sa.text("fire_policy IS NOT NULL"),
-    )
-    op.create_index(
-        "ix_structures_access_by_coach",
-        "structures",
-        ["access_by_coach"],
-        postgresql_where=sa.text("access_by_coach IS TRUE"),
-    )
-    op.create_index(
-        "ix_structures_access_by_public_transport",
-        "structures",
-        ["access_by_public_transport"],
-        postgresql_where=sa.text("access_by_public_transport IS TRUE"),
-    )
-
-    op.alter_column("structures", "hot_water", server_default=None)
-    op.alter_column("structures", "shelter_on_field", server_default=None)
-    op.alter_column("structures", "electricity_available", server_default=None)
-    op.alter_column("structures", "access_by_car", server_default=None)
-    op.alter_column("structures", "access_by_coach", server_default=None)
-    op.alter_column("structures", "access_by_public_transport", server_default=None)
-    op.alter_column("structures", "coach_turning_area", server_default=None)
-    op.alter_column("structures", "winter_open", server_default=None)
-    op.alter_column("structures", "weekend_only", server_default=None)
-    op.alter_column("structures", "has_field_poles", server_default=None)
-
 
 def downgrade() -> None:
-    op.execute("DROP INDEX IF EXISTS ix_structures_access_by_public_transport")
-    op.execute("DROP INDEX IF EXISTS ix_structures_access_by_coach")
-    op.execute("DROP INDEX IF EXISTS ix_structures_fire_policy")
-    op.execute("DROP INDEX IF EXISTS ix_structures_type")
-    op.execute("DROP INDEX IF EXISTS ix_structures_province")
-
-    op.create_index(
-        "ix_structures_type",
-        "structures",
-        ["type"],
-    )
-    op.create_index(
-        "ix_structures_province",
-        "structures",
-        ["province"],
-    )
-
-    op.drop_column("structures", "notes_logistics")
-    op.drop_column("structures", "has_field_poles")
-    op.drop_column("structures", "weekend_only")
-    op.drop_column("structures", "winter_open")
-    op.drop_column("structures", "nearest_bus_stop")
-    op.drop_column("structures", "max_vehicle_height_m")
-    op.drop_column("structures", "coach_turning_area")
-    op.drop_column("structures", "access_by_public_transport")
-    op.drop_column("structures", "access_by_coach")
-    op.drop_column("structures", "access_by_car")
-    op.drop_column("structures", "fire_policy")
-    op.drop_column("structures", "electricity_available")
-    op.drop_column("structures", "water_source")
-    op.drop_column("structures", "toilets_on_field")
-    op.drop_column("structures", "shelter_on_field")
-    op.drop_column("structures", "max_tents")
-    op.drop_column("structures", "land_area_m2")
-    op.drop_column("structures", "hot_water")
-
-    bind = op.get_bind()
-    fire_policy_enum = sa.Enum(
-        "allowed",
-        "with_permit",
-        "forbidden",
-        name="fire_policy",
-    )
-    water_source_enum = sa.Enum(
-        "none",
-        "fountain",
-        "tap",
-        "river",
-        name="water_source",
-    )
-
-    fire_policy_enum.drop(bind, checkfirst=True)
-    water_source_enum.drop(bind, checkfirst=True)
+    op.execute(
+        "DROP INDEX IF EXISTS ix_structures_access_by_public_transport;\n"
+        "DROP INDEX IF EXISTS ix_structures_access_by_coach;\n"
+        "DROP INDEX IF EXISTS ix_structures_fire_policy;\n"
+        "DROP INDEX IF EXISTS ix_structures_type;\n"
+        "DROP INDEX IF EXISTS ix_structures_province;\n"
+        'CREATE INDEX ix_structures_type ON "structures" (type);\n'
+        'CREATE INDEX ix_structures_province ON "structures" (province)'
+    )
+
+    op.execute(
+        'ALTER TABLE "structures" '
+        "DROP COLUMN notes_logistics, "
+        "DROP COLUMN has_field_poles, "
+        "DROP COLUMN weekend_only, "
+        "DROP COLUMN winter_open, "
+        "DROP COLUMN nearest_bus_stop, "
+        "DROP COLUMN max_vehicle_height_m, "
+        "DROP COLUMN coach_turning_area, "
+        "DROP COLUMN access_by_public_transport, "
+        "DROP COLUMN access_by_coach, "
+        "DROP COLUMN access_by_car, "
+        "DROP COLUMN fire_policy, "
+        "DROP COLUMN electricity_available, "
+        "DROP COLUMN water_source, "
+        "DROP COLUMN toilets_on_field, "
+        "DROP COLUMN shelter_on_field, "
+        "DROP COLUMN max_tents, "
+        "DROP COLUMN land_area_m2, "
+        "DROP COLUMN hot_water"
+    )
+
+    drop_enum_if_exists("fire_policy")
+    drop_enum_if_exists("water_source")
 
     op.alter_column("structures", "indoor_showers", new_column_name="showers")
     op.alter_column("structures", "indoor_bathrooms", new_column_name="bathrooms")
@@ -20,55 +20,20 @@ depends_on = None
 def upgrade() -> None:
     op.add_column("structures", sa.Column("website_urls", sa.JSON(), nullable=True))
 
-    structures = sa.table(
-        "structures",
-        sa.column("id", sa.Integer()),
-        sa.column("website_url", sa.String(length=255)),
-        sa.column("website_urls", sa.JSON()),
+    op.execute(
+        'UPDATE "structures" SET website_urls = json_build_array(website_url) '
+        "WHERE website_url IS NOT NULL AND website_url <> ''"
     )
 
-    connection = op.get_bind()
-    rows = connection.execute(
-        sa.select(structures.c.id, structures.c.website_url).where(
-            structures.c.website_url.isnot(None)
-        )
-    ).fetchall()
-
-    for structure_id, url in rows:
-        if not url:
-            continue
-        connection.execute(
-            sa.update(structures).where(structures.c.id == structure_id).values(website_urls=[url])
-        )
-
     op.drop_column("structures", "website_url")
 
 
 def downgrade() -> None:
     op.add_column("structures", sa.Column("website_url", sa.String(length=255), nullable=True))
 
-    structures = sa.table(
-        "structures",
-        sa.column("id", sa.Integer()),
-        sa.column("website_url", sa.String(length=255)),
-        sa.column("website_urls", sa.JSON()),
+    op.execute(
+        'UPDATE "structures" SET website_url = website_urls ->> 0 '
+        "WHERE json_typeof(website_urls) = 'array'"
     )
 
-    connection = op.get_bind()
-    rows = connection.execute(
-        sa.select(structures.c.id, structures.c.website_urls).where(
-            structures.c.website_urls.isnot(None)
-        )
-    ).fetchall()
-
-    for structure_id, urls in rows:
-        first_url = None
-        if isinstance(urls, (list, tuple)) and urls:
-            first_url = urls[0]
-        connection.execute(
-            sa.update(structures)
-            .where(structures.c.id == structure_id)
-            .values(website_url=first_url)
-        )
-
     op.drop_column("structures", "website_urls")
@@ -6,59 +6,42 @@ import sqlalchemy as sa
 from alembic import op
 from sqlalchemy.dialects import postgresql
 
+from migrations.utils.postgres import create_enums_if_not_exist, drop_enum_if_exists
+
 revision: str = "20240710_0013"
 down_revision: str | None = "20240704_0012"
 branch_labels = None
 depends_on = None
 
+OPEN_PERIOD_KIND_VALUES = ("season", "range")
+OPEN_PERIOD_SEASON_VALUES = ("spring", "summer", "autumn", "winter")
+
+kind_enum = postgresql.ENUM(
+    *OPEN_PERIOD_KIND_VALUES, name="structure_open_period_kind", create_type=False
+)
+season_enum = postgresql.ENUM(
+    *OPEN_PERIOD_SEASON_VALUES, name="structure_open_period_season", create_type=False
+)
+
 
 def upgrade() -> None:
     op.alter_column("structures", "dining_capacity", new_column_name="indoor_activity_rooms")
 
-    op.drop_column("structures", "max_vehicle_height_m")
-    op.drop_column("structures", "max_tents")
-    op.drop_column("structures", "toilets_on_field")
-    op.drop_column("structures", "winter_open")
-
-    op.add_column(
-        "structures",
-        sa.Column(
-            "pit_latrine_allowed",
-            sa.Boolean(),
-            nullable=False,
-            server_default=sa.text("false"),
-        ),
+    op.execute(
+        'ALTER TABLE "structures" '
+        "DROP COLUMN max_vehicle_height_m, "
+        "DROP COLUMN max_tents, "
+        "DROP COLUMN toilets_on_field, "
+        "DROP COLUMN winter_open, "
+        "ADD COLUMN pit_latrine_allowed BOOLEAN NOT NULL DEFAULT false;\n"
+        'ALTER TABLE "structures" ALTER COLUMN pit_latrine_allowed DROP DEFAULT'
     )
 
-    bind = op.get_bind()
-    kind_enum = postgresql.ENUM(
-        "season",
-        "range",
-        name="structure_open_period_kind",
-    )
-    season_enum = postgresql.ENUM(
-        "spring",
-        "summer",
-        "autumn",
-        "winter",
-        name="structure_open_period_season",
-    )
-    kind_enum.create(bind, checkfirst=True)
-    season_enum.create(bind, checkfirst=True)
-
-    kind_enum_column = postgresql.ENUM(
-        "season",
-        "range",
-        name="structure_open_period_kind",
-        create_type=False,
-    )
-    season_enum_column = postgresql.ENUM(
-        "spring",
-        "summer",
-        "autumn",
-        "winter",
-        name="structure_open_period_season",
-        create_type=False,
+    create_enums_if_not_exist(
+        {
+            "structure_open_period_kind": OPEN_PERIOD_KIND_VALUES,
+            "structure_open_period_season": OPEN_PERIOD_SEASON_VALUES,
+        }
     )
 
     op.create_table(
@@ -70,8 +53,8 @@ def upgrade() -> None:
             sa.ForeignKey("structures.id", ondelete="CASCADE"),
             nullable=False,
         ),
-        sa.Column("kind", kind_enum_column, nullable=False),
-        sa.Column("season", season_enum_column, nullable=True),
+        sa.Column("kind", kind_enum, nullable=False),
+        sa.Column("season", season_enum, nullable=True),
         sa.Column("date_start", sa.Date(), nullable=True),
         sa.Column("date_end", sa.Date(), nullable=True),
         sa.Column("notes", sa.Text(), nullable=True),
@@ -84,50 +67,29 @@ def upgrade() -> None:
             name="ck_structure_open_periods_kind_constraints",
         ),
     )
-    op.create_index(
-        "ix_structure_open_periods_structure_kind",
-        "structure_open_periods",
-        ["structure_id", "kind"],
-    )
-    op.create_index(
-        "ix_structure_open_periods_structure_season",
-        "structure_open_periods",
-        ["structure_id", "season"],
-    )
-    op.create_index(
-        "ix_structure_open_periods_structure_dates",
-        "structure_open_periods",
-        ["structure_id", "date_start", "date_end"],
+    op.execute(
+        "CREATE INDEX ix_structure_open_periods_structure_kind "
+        'ON "structure_open_periods" (structure_id, kind);\n'
+        "CREATE INDEX ix_structure_open_periods_structure_season "
+        'ON "structure_open_periods" (structure_id, season);\n'
+        "CREATE INDEX ix_structure_open_periods_structure_dates "
+        'ON "structure_open_periods" (structure_id, date_start, date_end)'
     )
 
-    op.alter_column("structures", "pit_latrine_allowed", server_default=None)
-
 
 def downgrade() -> None:
-    op.alter_column("structures", "pit_latrine_allowed", server_default=sa.text("false"))
-
-    op.drop_index("ix_structure_open_periods_structure_dates", table_name="structure_open_periods")
-    op.drop_index("ix_structure_open_periods_structure_season", table_name="structure_open_periods")
-    op.drop_index("ix_structure_open_periods_structure_kind", table_name="structure_open_periods")
     op.drop_table("structure_open_periods")
 
-    bind = op.get_bind()
-    season_enum = postgresql.ENUM(name="structure_open_period_season")
-    kind_enum = postgresql.ENUM(name="structure_open_period_kind")
-    season_enum.drop(bind, checkfirst=True)
-    kind_enum.drop(bind, checkfirst=True)
+    drop_enum_if_exists("structure_open_period_season")
+    drop_enum_if_exists("structure_open_period_kind")
 
-    op.drop_column("structures", "pit_latrine_allowed")
-
-    op.add_column(
-        "structures",
-        sa.Column("winter_open", sa.Boolean(), nullable=False, server_default=sa.text("false")),
-    )
-    op.add_column("structures", sa.Column("toilets_on_field", sa.Integer(), nullable=True))
-    op.add_column("structures", sa.Column("max_tents", sa.Integer(), nullable=True))
-    op.add_column(
-        "structures",
-        sa.Column("max_vehicle_height_m", sa.Numeric(4, 2), nullable=True),
+    op.execute(
+        'ALTER TABLE "structures" '
+        "DROP COLUMN pit_latrine_allowed, "
+        "ADD COLUMN winter_open BOOLEAN NOT NULL DEFAULT false, "
+        "ADD COLUMN toilets_on_field INTEGER, "
+        "ADD COLUMN max_tents INTEGER, "
+        "ADD COLUMN max_vehicle_height_m NUMERIC(4, 2)"
     )
 
     op.alter_column("structures", "indoor_activity_rooms", new_column_name="dining_capacity")
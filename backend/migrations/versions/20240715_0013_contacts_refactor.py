@@ -119,23 +119,13 @@ def upgrade() -> None:
             """
         )
 
-    op.create_index(
-        "idx_structure_contacts_structure",
-        "structure_contacts",
-        ["structure_id"],
-    )
-    op.create_index(
-        "idx_structure_contacts_contact",
-        "structure_contacts",
-        ["contact_id"],
-    )
-    op.create_index(
-        "uix_structure_contacts_primary",
-        "structure_contacts",
-        ["structure_id"],
-        unique=True,
-        postgresql_where=sa.text("is_primary"),
-        sqlite_where=sa.text("is_primary = 1"),
+    op.execute(
+        "CREATE INDEX idx_structure_contacts_structure "
+        'ON "structure_contacts" (structure_id);\n'
+        "CREATE INDEX idx_structure_contacts_contact "
+        'ON "structure_contacts" (contact_id);\n'
+        "CREATE UNIQUE INDEX uix_structure_contacts_primary "
+        'ON "structure_contacts" (structure_id) WHERE is_primary'
     )
 
     # Drop constraints that depended on structure-specific data
@@ -203,11 +193,12 @@ def downgrade() -> None:
     )
 
     if insp.has_table("structure_contacts"):
-        # Copy data back into the contact table. Pick the first structure when multiple exist.
+        # Copy data back into the contact table, picking the first structure when
+        # multiple exist, and rebuild name from first/last name with fallbacks.
         op.execute(
             """
             WITH ranked AS (
-                SELECT
+                SELECT DISTINCT ON (sc.contact_id)
                     sc.contact_id,
                     sc.structure_id,
                     sc.role,
@@ -215,71 +206,31 @@ def downgrade() -> None:
                     sc.is_primary,
                     sc.gdpr_consent_at,
                     sc.created_at,
-                    sc.updated_at,
-                    ROW_NUMBER() OVER (
-                        PARTITION BY sc.contact_id
-                        ORDER BY sc.is_primary DESC, sc.created_at
-                    ) AS rn
+                    sc.updated_at
                 FROM structure_contacts sc
+                ORDER BY sc.contact_id, sc.is_primary DESC, sc.created_at
             )
             UPDATE contacts c
             SET
-                structure_id = ranked.structure_id,
-                role = ranked.role,
-                preferred_channel = ranked.preferred_channel,
-                is_primary = ranked.is_primary,
-                gdpr_consent_at = ranked.gdpr_consent_at,
-                created_at = ranked.created_at,
-                updated_at = ranked.updated_at
-            FROM ranked
-            WHERE ranked.contact_id = c.id AND ranked.rn = 1
-            """
-        )
-
-        # Populate name column from first/last name fallback data
-        op.execute(
-            """
-            UPDATE contacts
-            SET name = TRIM(
-                COALESCE(NULLIF(first_name, ''), '') ||
-                CASE
-                    WHEN first_name IS NOT NULL AND first_name <> ''
-                        AND last_name IS NOT NULL AND last_name <> ''
-                        THEN ' ' || last_name
-                    WHEN (first_name IS NULL OR first_name = '')
-                        AND last_name IS NOT NULL AND last_name <> ''
-                        THEN last_name
-                    ELSE ''
-                END
-            )
-            """
-        )
-
-        # Provide fallbacks for empty names
-        op.execute(
-            """
-            UPDATE contacts
-            SET name = COALESCE(NULLIF(name, ''), COALESCE(email, phone, 'Contatto'))
-            """
-        )
-
-        # Ensure structure_id is filled for existing links
-        op.execute(
-            """
-            WITH ranked AS (
-                SELECT
-                    sc.contact_id,
-                    sc.structure_id,
-                    ROW_NUMBER() OVER (
-                        PARTITION BY sc.contact_id
-                        ORDER BY sc.is_primary DESC, sc.created_at
-                    ) AS rn
-                FROM structure_contacts sc
-            )
-            UPDATE contacts c
-            SET structure_id = ranked.structure_id
-            FROM ranked
-            WHERE ranked.contact_id = c.id AND ranked.rn = 1
+                structure_id = COALESCE(ranked.structure_id, c.structure_id),
+                role = COALESCE(ranked.role, c.role),
+                preferred_channel = COALESCE(ranked.preferred_channel, c.preferred_channel),
+                is_primary = COALESCE(ranked.is_primary, c.is_primary),
+                gdpr_consent_at = COALESCE(ranked.gdpr_consent_at, c.gdpr_consent_at),
+                created_at = COALESCE(ranked.created_at, c.created_at),
+                updated_at = COALESCE(ranked.updated_at, c.updated_at),
+                name = COALESCE(
+                    NULLIF(
+                        TRIM(CONCAT_WS(' ', NULLIF(c.first_name, ''), NULLIF(c.last_name, ''))),
+                        ''
+                    ),
+                    c.email,
+                    c.phone,
+                    'Contatto'
+                )
+            FROM contacts target
+            LEFT JOIN ranked ON ranked.contact_id = target.id
+            WHERE target.id = c.id
             """
         )
 
@@ -295,9 +246,6 @@ def downgrade() -> None:
     )
     op.create_unique_constraint("uq_contact_structure_email", "contacts", ["structure_id", "email"])
 
-    op.drop_index("uix_structure_contacts_primary", table_name="structure_contacts")
-    op.drop_index("idx_structure_contacts_contact", table_name="structure_contacts")
-    op.drop_index("idx_structure_contacts_structure", table_name="structure_contacts")
     op.drop_table("structure_contacts")
 
     op.drop_column("contacts", "last_name")
@@ -15,6 +15,8 @@ down_revision: str | None = "20240730_0014"
 branch_labels: Sequence[str] | None = None
 depends_on: Sequence[str] | None = None
 
+WATER_SOURCE_VALUES = ("none", "fountain", "tap", "river")
+
 
 def upgrade() -> None:
     op.add_column(
@@ -34,25 +36,20 @@ def upgrade() -> None:
 
 
 def downgrade() -> None:
-    water_source_enum = sa.Enum(
-        "none",
-        "fountain",
-        "tap",
-        "river",
-        name="water_source",
-        create_type=False,
-    )
+    water_source_enum = sa.Enum(*WATER_SOURCE_VALUES, name="water_source", create_type=False)
 
     op.add_column(
         "structures",
         sa.Column("water_source", water_source_enum, nullable=True),
     )
 
+    allowed_values = ", ".join(f"'{value}'" for value in WATER_SOURCE_VALUES)
     op.execute(
-        """
+        f"""
         UPDATE structures
-        SET water_source = water_sources->>0
-        WHERE water_sources IS NOT NULL AND json_array_length(water_sources) >= 1
+        SET water_source = (water_sources->>0)::water_source
+        WHERE json_typeof(water_sources) = 'array'
+          AND water_sources->>0 IN ({allowed_values})
         """
     )
 
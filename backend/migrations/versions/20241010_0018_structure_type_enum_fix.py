@@ -2,7 +2,7 @@
 
 from collections.abc import Sequence
 
-from migrations.utils.postgres import add_enum_value_if_missing
+from migrations.utils.postgres import add_enum_values_if_missing
 
 revision: str = "20241010_0018"
 down_revision: str | None = "20240920_0017"
@@ -11,8 +11,7 @@ depends_on: Sequence[str] | None = None
 
 
 def upgrade() -> None:
-    add_enum_value_if_missing("structure_type", "land")
-    add_enum_value_if_missing("structure_type", "mixed")
+    add_enum_values_if_missing("structure_type", ["land", "mixed"])
 
 
 def downgrade() -> None:
@@ -7,7 +7,6 @@ Create Date: 2024-11-12 00:21:00.000000
 
 from collections.abc import Sequence
 
-import sqlalchemy as sa
 from alembic import op
 
 description = "Allow nullable utility flags for structures"
@@ -33,27 +32,26 @@ FLAG_COLUMNS = [
 
 
 def upgrade() -> None:
-    for column in FLAG_COLUMNS:
-        op.alter_column(
-            "structures",
-            column,
-            existing_type=sa.Boolean(),
-            nullable=True,
-            existing_server_default=sa.text("false"),
-            server_default=None,
+    op.execute(
+        "ALTER TABLE structures "
+        + ", ".join(
+            f"ALTER COLUMN {column} DROP NOT NULL, ALTER COLUMN {column} DROP DEFAULT"
+            for column in FLAG_COLUMNS
         )
+    )
 
 
 def downgrade() -> None:
-    for column in FLAG_COLUMNS:
-        op.execute(
-            sa.text("UPDATE structures SET " + column + " = false WHERE " + column + " IS NULL")
-        )
-        op.alter_column(
-            "structures",
-            column,
-            existing_type=sa.Boolean(),
-            nullable=False,
-            existing_server_default=None,
-            server_default=sa.text("false"),
+    op.execute(
+        "UPDATE structures SET "
+        + ", ".join(f"{column} = COALESCE({column}, false)" for column in FLAG_COLUMNS)
+        + " WHERE "
+        + " OR ".join(f"{column} IS NULL" for column in FLAG_COLUMNS)
+    )
+    op.execute(
+        "ALTER TABLE structures "
+        + ", ".join(
+            f"ALTER COLUMN {column} SET NOT NULL, ALTER COLUMN {column} SET DEFAULT false"
+            for column in FLAG_COLUMNS
         )
+    )
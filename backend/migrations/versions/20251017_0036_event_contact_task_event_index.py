@@ -0,0 +1,30 @@
+"""
+Index event contact tasks by event
+
+Revision ID: 20251017_0036
+Revises: 20250815_0035
+Create Date: 2025-10-17 00:00:00.000000
+"""
+
+from typing import Union
+
+from alembic import op
+
+from migrations.utils.postgres import create_index_if_not_exists
+
+# revision identifiers, used by Alembic.
+revision: str = "20251017_0036"
+down_revision: Union[str, None] = "20250815_0035"
+branch_labels: Union[str, None] = None
+depends_on: Union[str, None] = None
+
+
+def upgrade() -> None:
+    create_index_if_not_exists(
+        "CREATE INDEX IF NOT EXISTS ix_event_contact_task_event_id "
+        'ON "event_contact_task" (event_id)'
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_event_contact_task_event_id")
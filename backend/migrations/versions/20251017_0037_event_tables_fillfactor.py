@@ -0,0 +1,31 @@
+"""
+Leave room for HOT updates on event workflow tables
+
+Revision ID: 20251017_0037
+Revises: 20251017_0036
+Create Date: 2025-10-17 00:01:00.000000
+"""
+
+from typing import Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20251017_0037"
+down_revision: Union[str, None] = "20251017_0036"
+branch_labels: Union[str, None] = None
+depends_on: Union[str, None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        'ALTER TABLE "event_structure_candidate" SET (fillfactor = 85);\n'
+        'ALTER TABLE "event_contact_task" SET (fillfactor = 85)'
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        'ALTER TABLE "event_contact_task" RESET (fillfactor);\n'
+        'ALTER TABLE "event_structure_candidate" RESET (fillfactor)'
+    )
@@ -0,0 +1,35 @@
+"""
+Drop single-column season availability indexes covered by the composite
+
+Revision ID: 20251017_0038
+Revises: 20251017_0037
+Create Date: 2025-10-17 00:02:00.000000
+"""
+
+from typing import Union
+
+from alembic import op
+
+from migrations.utils.postgres import create_indexes_if_not_exist
+
+# revision identifiers, used by Alembic.
+revision: str = "20251017_0038"
+down_revision: Union[str, None] = "20251017_0037"
+branch_labels: Union[str, None] = None
+depends_on: Union[str, None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "DROP INDEX IF EXISTS ix_structure_season_availability_season;\n"
+        "DROP INDEX IF EXISTS ix_structure_season_availability_structure_id"
+    )
+
+
+def downgrade() -> None:
+    create_indexes_if_not_exist(
+        "CREATE INDEX IF NOT EXISTS ix_structure_season_availability_structure_id "
+        'ON "structure_season_availability" (structure_id)',
+        "CREATE INDEX IF NOT EXISTS ix_structure_season_availability_season "
+        'ON "structure_season_availability" (season)',
+    )
@@ -0,0 +1,43 @@
+"""
+Index auth token lookups by hash and live reset tokens by user
+
+Revision ID: 20251017_0039
+Revises: 20251017_0038
+Create Date: 2025-10-17 00:03:00.000000
+"""
+
+from typing import Union
+
+from alembic import op
+
+from migrations.utils.postgres import create_indexes_if_not_exist
+
+# revision identifiers, used by Alembic.
+revision: str = "20251017_0039"
+down_revision: Union[str, None] = "20251017_0038"
+branch_labels: Union[str, None] = None
+depends_on: Union[str, None] = None
+
+
+def upgrade() -> None:
+    create_indexes_if_not_exist(
+        "CREATE INDEX IF NOT EXISTS ix_refresh_tokens_token_hash "
+        'ON "refresh_tokens" (token_hash)',
+        "CREATE INDEX IF NOT EXISTS ix_password_reset_tokens_token_hash "
+        'ON "password_reset_tokens" (token_hash)',
+        "CREATE INDEX IF NOT EXISTS ix_password_reset_tokens_user_id_active "
+        'ON "password_reset_tokens" (user_id) WHERE used IS false',
+    )
+    op.execute("DROP INDEX IF EXISTS ix_password_reset_tokens_user_id_used")
+
+
+def downgrade() -> None:
+    create_indexes_if_not_exist(
+        "CREATE INDEX IF NOT EXISTS ix_password_reset_tokens_user_id_used "
+        'ON "password_reset_tokens" (user_id, used)',
+    )
+    op.execute(
+        "DROP INDEX IF EXISTS ix_password_reset_tokens_user_id_active;\n"
+        "DROP INDEX IF EXISTS ix_password_reset_tokens_token_hash;\n"
+        "DROP INDEX IF EXISTS ix_refresh_tokens_token_hash"
+    )
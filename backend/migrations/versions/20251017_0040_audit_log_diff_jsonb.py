@@ -0,0 +1,25 @@
+"""
+Store audit log diffs as JSONB
+
+Revision ID: 20251017_0040
+Revises: 20251017_0039
+Create Date: 2025-10-17 00:04:00.000000
+"""
+
+from typing import Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20251017_0040"
+down_revision: Union[str, None] = "20251017_0039"
+branch_labels: Union[str, None] = None
+depends_on: Union[str, None] = None
+
+
+def upgrade() -> None:
+    op.execute('ALTER TABLE "audit_log" ALTER COLUMN diff TYPE jsonb USING diff::jsonb')
+
+
+def downgrade() -> None:
+    op.execute('ALTER TABLE "audit_log" ALTER COLUMN diff TYPE json USING diff::json')
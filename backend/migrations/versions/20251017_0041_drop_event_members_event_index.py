@@ -0,0 +1,29 @@
+"""
+Drop event_members event_id index covered by the unique constraint
+
+Revision ID: 20251017_0041
+Revises: 20251017_0040
+Create Date: 2025-10-17 00:05:00.000000
+"""
+
+from typing import Union
+
+from alembic import op
+
+from migrations.utils.postgres import create_index_if_not_exists
+
+# revision identifiers, used by Alembic.
+revision: str = "20251017_0041"
+down_revision: Union[str, None] = "20251017_0040"
+branch_labels: Union[str, None] = None
+depends_on: Union[str, None] = None
+
+
+def upgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_event_members_event_id")
+
+
+def downgrade() -> None:
+    create_index_if_not_exists(
+        'CREATE INDEX IF NOT EXISTS ix_event_members_event_id ON "event_members" (event_id)'
+    )
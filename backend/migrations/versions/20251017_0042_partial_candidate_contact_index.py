@@ -0,0 +1,33 @@
+"""
+Limit the candidate contact index to rows with a contact
+
+Revision ID: 20251017_0042
+Revises: 20251017_0041
+Create Date: 2025-10-17 00:06:00.000000
+"""
+
+from typing import Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20251017_0042"
+down_revision: Union[str, None] = "20251017_0041"
+branch_labels: Union[str, None] = None
+depends_on: Union[str, None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "DROP INDEX IF EXISTS ix_event_structure_candidate_contact_id;\n"
+        "CREATE INDEX ix_event_structure_candidate_contact_id "
+        'ON "event_structure_candidate" (contact_id) WHERE contact_id IS NOT NULL'
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "DROP INDEX IF EXISTS ix_event_structure_candidate_contact_id;\n"
+        "CREATE INDEX ix_event_structure_candidate_contact_id "
+        'ON "event_structure_candidate" (contact_id)'
+    )
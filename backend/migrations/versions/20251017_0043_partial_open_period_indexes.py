@@ -0,0 +1,40 @@
+"""
+Restrict open period season/date indexes to their period kind
+
+Revision ID: 20251017_0043
+Revises: 20251017_0042
+Create Date: 2025-10-17 00:07:00.000000
+"""
+
+from typing import Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20251017_0043"
+down_revision: Union[str, None] = "20251017_0042"
+branch_labels: Union[str, None] = None
+depends_on: Union[str, None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "DROP INDEX IF EXISTS ix_structure_open_periods_structure_season;\n"
+        "DROP INDEX IF EXISTS ix_structure_open_periods_structure_dates;\n"
+        "CREATE INDEX ix_structure_open_periods_structure_season "
+        "ON \"structure_open_periods\" (structure_id, season) WHERE kind = 'season';\n"
+        "CREATE INDEX ix_structure_open_periods_structure_dates "
+        'ON "structure_open_periods" (structure_id, date_start, date_end) '
+        "WHERE kind = 'range'"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "DROP INDEX IF EXISTS ix_structure_open_periods_structure_season;\n"
+        "DROP INDEX IF EXISTS ix_structure_open_periods_structure_dates;\n"
+        "CREATE INDEX ix_structure_open_periods_structure_season "
+        'ON "structure_open_periods" (structure_id, season);\n'
+        "CREATE INDEX ix_structure_open_periods_structure_dates "
+        'ON "structure_open_periods" (structure_id, date_start, date_end)'
+    )
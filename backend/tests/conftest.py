@@ -22,6 +22,10 @@ _ensure_backend_on_path()
 os.environ.setdefault("DATABASE_URL", "sqlite+pysqlite:///./test.db")
 os.environ.setdefault("APP_ENV", "test")
 os.environ.setdefault("ALLOW_NON_ADMIN_STRUCTURE_EDIT", "false")
+# Cheap password hashing keeps user fixtures fast; hashes still verify normally.
+os.environ.setdefault("ARGON2_TIME_COST", "1")
+os.environ.setdefault("ARGON2_MEMORY_COST", "8")
+os.environ.setdefault("ARGON2_PARALLELISM", "1")
 
 from app.core.config import get_settings  # noqa: E402
 
@@ -69,3 +69,23 @@ def test_auth_flow_register_login_refresh_logout_me(client: TestClient) -> None:
 
     unauthorized_me = client.get("/api/v1/auth/me")
     assert unauthorized_me.status_code == 401
+
+
+def test_password_hash_uses_configured_cost_and_verifies_existing_hashes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from app.core.security import hash_password, verify_password
+
+    legacy_hash = hash_password("secret")
+
+    monkeypatch.setenv("ARGON2_TIME_COST", "2")
+    monkeypatch.setenv("ARGON2_MEMORY_COST", "16")
+    monkeypatch.setenv("ARGON2_PARALLELISM", "1")
+    get_settings.cache_clear()  # type: ignore[attr-defined]
+
+    password_hash = hash_password("secret")
+
+    assert "$m=16,t=2,p=1$" in password_hash
+    assert verify_password("secret", password_hash)
+    assert verify_password("secret", legacy_hash)
+    assert not verify_password("other", password_hash)
@@ -41,6 +41,8 @@ def test_structure_indexes_exist() -> None:
 def test_structure_child_indexes_exist() -> None:
     availability_indexes = _index_names("structure_season_availability")
     assert "ix_structure_season_availability_structure_id_season" in availability_indexes
+    assert "ix_structure_season_availability_structure_id" not in availability_indexes
+    assert "ix_structure_season_availability_season" not in availability_indexes
 
     cost_indexes = _index_names("structure_cost_option")
     assert "ix_structure_cost_option_structure_id_model" in cost_indexes
@@ -1,10 +1,24 @@
 import csv
-from io import StringIO
+from datetime import date, datetime
+from io import BytesIO, StringIO
 
 import json
+import zipfile
+
+import pytest
+from openpyxl import Workbook
 
 from app.models.structure import WaterSource
-from app.services.structures_import import HEADERS, parse_structures_csv, parse_structures_json
+from app.services.structures_import import (
+    HEADERS,
+    OPEN_PERIOD_HEADERS,
+    _process_open_period_rows,
+    _process_rows,
+    parse_structure_open_periods_csv,
+    parse_structures_csv,
+    parse_structures_json,
+    parse_structures_xlsx,
+)
 
 
 def _build_csv(rows: list[dict[str, object]]) -> bytes:
@@ -169,3 +183,104 @@ def test_parse_structures_json_accepts_lists_and_booleans() -> None:
     assert row.contact_emails == ["info@example.org"]
     assert row.website_urls == ["https://example.org"]
     assert row.water_sources == [WaterSource.TAP, WaterSource.RIVER]
+
+
+def test_row_cap_stops_reading_source() -> None:
+    consumed: list[int] = []
+
+    def _rows():
+        for index in range(2, 10):
+            consumed.append(index)
+            yield index, (f"Casa {index}", f"casa-{index}", "MI", None, None, None, None, "house")
+
+    with pytest.raises(ValueError, match="Maximum allowed is 2"):
+        _process_rows(_rows(), source_format="csv", max_rows=2)
+
+    assert consumed == [2, 3, 4]
+
+
+def test_parse_structures_xlsx_keeps_sheet_row_numbers() -> None:
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append(HEADERS)
+    sheet.append(["Casa Uno", "casa-uno", "MI", None, None, None, None, "house"])
+    sheet["A4"] = "Casa Due"
+    sheet["B4"] = "casa-due"
+    sheet["C4"] = "Lombardia"
+    sheet["H4"] = "house"
+    buffer = BytesIO()
+    workbook.save(buffer)
+
+    result = parse_structures_xlsx(buffer.getvalue())
+
+    assert [row.slug for row in result.rows] == ["casa-uno"]
+    assert result.blank_rows == 1
+    assert [(error.row, error.field) for error in result.errors] == [(4, "province")]
+
+
+def test_parse_structures_xlsx_rejects_invalid_archive() -> None:
+    with pytest.raises(ValueError, match="Invalid XLSX file"):
+        parse_structures_xlsx(b"not a spreadsheet")
+
+
+def test_parse_structures_xlsx_rejects_xml_entities() -> None:
+    workbook = Workbook()
+    workbook.active.append(HEADERS)
+    buffer = BytesIO()
+    workbook.save(buffer)
+
+    patched = BytesIO()
+    with (
+        zipfile.ZipFile(BytesIO(buffer.getvalue())) as source,
+        zipfile.ZipFile(patched, "w") as target,
+    ):
+        for item in source.infolist():
+            content = source.read(item)
+            if item.filename == "xl/workbook.xml":
+                content = b'<!DOCTYPE bomb [<!ENTITY a "aaaa">]>' + content
+            target.writestr(item, content)
+
+    with pytest.raises(ValueError, match="Invalid XLSX file"):
+        parse_structures_xlsx(patched.getvalue())
+
+
+def test_open_period_unit_errors_share_message() -> None:
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(OPEN_PERIOD_HEADERS)
+    for _ in range(3):
+        writer.writerow(["casa-uno", "season", "summer", "LC;XX", "", "", ""])
+
+    result = parse_structure_open_periods_csv(buffer.getvalue().encode("utf-8"))
+
+    messages = [error.message for error in result.errors if error.field == "units"]
+    assert messages == ["Invalid units: XX"] * 3
+    assert all(message is messages[0] for message in messages)
+
+
+def test_open_period_dates_accept_typed_cells_and_iso_text() -> None:
+    rows = iter(
+        [
+            (2, ("casa-uno", "range", None, None, datetime(2025, 6, 1), date(2025, 6, 30), None)),
+            (3, ("casa-uno", "range", None, None, "2025-07-01", "2025-07-31", None)),
+            (4, ("casa-uno", "range", None, None, "01/08/2025", "2025-08-31", None)),
+        ]
+    )
+
+    result = _process_open_period_rows(rows, source_format="xlsx", max_rows=10)
+
+    assert [(row.date_start, row.date_end) for row in result.rows] == [
+        (date(2025, 6, 1), date(2025, 6, 30)),
+        (date(2025, 7, 1), date(2025, 7, 31)),
+    ]
+    assert [(error.row, error.field, error.message) for error in result.errors] == [
+        (4, "date_start", "Invalid date"),
+        (4, "date_start", "Both date_start and date_end are required for kind=range"),
+    ]
+
+
+def test_parse_structures_csv_rejects_invalid_utf8_after_header() -> None:
+    data = _build_csv([{"name": "Casa", "slug": "casa", "province": "MI", "type": "house"}])
+
+    with pytest.raises(ValueError, match="CSV must be UTF-8 encoded"):
+        parse_structures_csv(data + b"Casa \xff,casa-due,MI\n")
@@ -15,7 +15,11 @@ os.environ.setdefault("APP_ENV", "test")
 
 from app.core.db import Base, engine  # noqa: E402
 from app.main import app  # noqa: E402
-from app.services.structures_import import HEADERS, OPEN_PERIOD_HEADERS  # noqa: E402
+from app.services.structures_import import (  # noqa: E402
+    HEADERS,
+    OPEN_PERIOD_HEADERS,
+    build_structure_open_periods_template_workbook,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -105,6 +109,19 @@ def test_structure_open_periods_template_xlsx_download() -> None:
     workbook.close()
 
 
+def test_structure_open_periods_template_xlsx_is_built_once() -> None:
+    client = get_client()
+    first = client.get("/api/v1/templates/structure-open-periods.xlsx")
+    second = client.get("/api/v1/templates/structure-open-periods.xlsx")
+
+    assert first.status_code == second.status_code == 200
+    assert first.content == second.content
+    assert (
+        build_structure_open_periods_template_workbook()
+        is build_structure_open_periods_template_workbook()
+    )
+
+
 def test_structure_open_periods_template_csv_download() -> None:
     client = get_client()
     response = client.get("/api/v1/templates/structure-open-periods.csv")
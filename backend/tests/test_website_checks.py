@@ -0,0 +1,51 @@
+import os
+from collections.abc import Generator
+
+import pytest
+
+os.environ.setdefault("DATABASE_URL", "sqlite+pysqlite:///./test.db")
+os.environ.setdefault("APP_ENV", "test")
+
+from app.api.v1 import structures as structures_api  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def clear_website_cache() -> Generator[None, None, None]:
+    structures_api._website_check_cache.clear()
+    yield
+    structures_api._website_check_cache.clear()
+
+
+def test_website_checks_reuse_cached_results(monkeypatch: pytest.MonkeyPatch) -> None:
+    probed: list[list[str]] = []
+
+    async def fake_probe(urls: list[str]) -> set[str]:
+        probed.append(list(urls))
+        return {url for url in urls if "offline" in url}
+
+    monkeypatch.setattr(structures_api, "_find_unreachable_urls", fake_probe)
+
+    urls = ["https://example.org/casa", "https://offline.example.org/"]
+    assert structures_api._check_website_urls(urls) == ["https://offline.example.org/"]
+    assert structures_api._check_website_urls(
+        ["https://EXAMPLE.org/casa", "https://offline.example.org/", "https://example.org/new"]
+    ) == ["https://offline.example.org/"]
+
+    assert probed == [urls, ["https://example.org/new"]]
+
+
+def test_website_check_cache_expires(monkeypatch: pytest.MonkeyPatch) -> None:
+    probed: list[str] = []
+
+    async def fake_probe(urls: list[str]) -> set[str]:
+        probed.extend(urls)
+        return set()
+
+    monkeypatch.setattr(structures_api, "_find_unreachable_urls", fake_probe)
+
+    monkeypatch.setattr(structures_api, "_WEBSITE_CHECK_CACHE_TTL", -1.0)
+
+    structures_api._check_website_urls(["https://example.org/"])
+    structures_api._check_website_urls(["https://example.org/"])
+
+    assert probed == ["https://example.org/", "https://example.org/"]